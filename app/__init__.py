@@ -16,6 +16,7 @@ Main Features:
 
 - **Extensions and Middleware**:
   - Registers extensions like CORS, error handlers, and template filters.
+  - Installs a msgspec based JSON provider for faster JSON encoding and decoding.
   - Configures before and after request hooks for request timing and clickjacking protection.
 
 - **Blueprints**:
@@ -32,6 +33,8 @@ Main Features:
 - **Security Enhancements**:
   - Configures security headers like `X-Frame-Options` and `Content-Security-Policy` 
     to protect against clickjacking and other attacks.
+  - The header values are built once; call `refresh_security_headers()` after
+    changing `ALLOWED_SOURCES` at runtime.
 
 Environment Variables:
 - `SECRET_KEY`: The secret key for the Flask application.
@@ -42,6 +45,9 @@ Environment Variables:
 - `SENTRY_DSN`: The DSN for Sentry integration (optional).
 - `OIDC_CLIENT_ID`, `OIDC_CREDENTIALS_SECRET`, `KEYCLOAK_TOKEN_URI`, `KEYCLOAK_INTROSPECT_URI`: 
    Keycloak configuration settings.
+- `KEYCLOAK_TOKEN_CACHE_TTL`: Seconds a token introspection result is cached (default: 60).
+- `THEME`, `PORTAL_NAME`, `MATOMO_ENABLED`, `MATOMO_URL`, `MATOMO_SITE_ID`:
+   Theme and Matomo settings, copied into the app configuration at startup.
 - `ENABLED_BLUEPRINTS`: Comma-separated list of blueprints to load.
 - `ALLOWED_SOURCES`: Sources allowed in the `X-Frame-Options` header for clickjacking protection.
 
@@ -63,6 +69,7 @@ Notes:
 """
 
 
+import importlib
 import logging
 import os
 import sys
@@ -80,6 +87,7 @@ from flasgger import Swagger
 from app.extensions import cors
 from app.public.views import blueprint as public_blueprint
 from .template_filters import register_template_filters
+from .json_provider import register_json_provider
 from .error_handlers import register_error_handlers
 from .logging_setup import (
     setup_file_handler,
@@ -103,20 +111,21 @@ def check_if_env_file_exists():
     return True
 
 
+REQUIRED_ENV_VARIABLES = ("SECRET_KEY",)
+
+
 def check_if_required_env_variables_are_set():
     """
     Check if required environment variables are set.
+    Empty values count as not set.
     """
-    required_env_variables = [
-        "SECRET_KEY",
-    ]
     print("Info: checking if required environment variables are set")
-    print(f"Info: required environment variables: {required_env_variables}")
-    for env_variable in required_env_variables:
-        if not os.getenv(env_variable):
-            logging.error("Error: %s not set", env_variable)
-            return False
-    return True
+    print(f"Info: required environment variables: {list(REQUIRED_ENV_VARIABLES)}")
+    environ = os.environ
+    missing = [name for name in REQUIRED_ENV_VARIABLES if not environ.get(name)]
+    for env_variable in missing:
+        logging.error("Error: %s not set", env_variable)
+    return not missing
 
 
 def validate_app_env():
@@ -142,6 +151,18 @@ if is_sentry_enabled():
     )
 
 
+def configure_portal_settings(flask_app):
+    """
+    Store the theme and Matomo settings in the app configuration.
+    They are read once here instead of from the environment on every request.
+    """
+    flask_app.config["THEME"] = os.getenv("THEME", "default")
+    flask_app.config["PORTAL_NAME"] = os.getenv("PORTAL_NAME", "RIS Synergy")
+    flask_app.config["MATOMO_ENABLED"] = os.getenv("MATOMO_ENABLED", "true")
+    flask_app.config["MATOMO_URL"] = os.getenv("MATOMO_URL", "")
+    flask_app.config["MATOMO_SITE_ID"] = os.getenv("MATOMO_SITE_ID", "")
+
+
 def configure_keycloak_settings(flask_app):
     """
     Configure Keycloak settings if the required environment variables are set.
@@ -158,6 +179,9 @@ def configure_keycloak_settings(flask_app):
         flask_app.config["KEYCLOAK_INTROSPECT_URI"] = os.getenv(
             "KEYCLOAK_INTROSPECT_URI"
         )
+        flask_app.config["KEYCLOAK_TOKEN_CACHE_TTL"] = int(
+            os.getenv("KEYCLOAK_TOKEN_CACHE_TTL", "60")
+        )
         logging.info("Keycloak settings configured")
         return True
     logging.info("Keycloak settings not configured or empty")
@@ -206,8 +230,10 @@ def create_app():
         # )  # Generates a 32-character hexadecimal string (16 bytes)
 
         flask_app.config["SECRET_KEY"] = os.getenv("SECRET_KEY")
+        configure_portal_settings(flask_app)
 
         configure_logger(flask_app)
+        register_json_provider(flask_app)
         register_error_handlers(flask_app)
         register_template_filters(flask_app)
         register_blueprints(flask_app)
@@ -268,7 +294,7 @@ def register_blueprints(flask_app) -> None:
     print("Enabled blueprints: ", enabled_blueprints)
     for blueprint_name in enabled_blueprints.split(","):
         try:
-            blueprint = __import__(f"app.{blueprint_name}.views", fromlist=[""])
+            blueprint = importlib.import_module(f"app.{blueprint_name}.views")
             flask_app.register_blueprint(blueprint.blueprint)
             print(f"Registered blueprint: {blueprint_name}")
         except ImportError as e:
@@ -358,33 +384,70 @@ def before_request():
     g.request_time = lambda: f"{time.time() - g.request_start_time:.5f}s"
 
 
-@app.after_request
-def apply_clickjacking_protection(response):
+# Clickjacking protection headers, built from ALLOWED_SOURCES once instead of per response
+_FRAME_HEADERS = {}
+
+
+def refresh_security_headers():
     """
-    Apply clickjacking protection to all responses
+    Rebuild the clickjacking protection headers from the environment
     """
-    # Set security headers to prevent clickjacking
     # env var ALLOWED_SOURCES can be set to allow framing from specific sources
     allowed_sources = os.getenv("ALLOWED_SOURCES")
     if allowed_sources:
         # Allow framing from specific sources
-        # set response headers to allow framing from the specified sources
-        response.headers["X-Frame-Options"] = f"ALLOW-FROM  {allowed_sources}"
-        response.headers["Content-Security-Policy"] = (
-            f"frame-ancestors {allowed_sources}"
-        )
+        headers = {
+            "X-Frame-Options": f"ALLOW-FROM  {allowed_sources}",
+            "Content-Security-Policy": f"frame-ancestors {allowed_sources}",
+        }
     else:
-        response.headers["X-Frame-Options"] = (
+        headers = {
             # "SAMEORIGIN" to allow framing from the same origin
             # Or "DENY" if you don't want to allow framing even from the same origin
-            "SAMEORIGIN"
-        )
-        response.headers["Content-Security-Policy"] = "frame-ancestors 'self'"
+            "X-Frame-Options": "SAMEORIGIN",
+            "Content-Security-Policy": "frame-ancestors 'self'",
+        }
     # Prevent MIME sniffing
-    response.headers["X-Content-Type-Options"] = "nosniff"
+    headers["X-Content-Type-Options"] = "nosniff"
+    _FRAME_HEADERS.clear()
+    _FRAME_HEADERS.update(headers)
+
+
+refresh_security_headers()
+
+
+@app.after_request
+def apply_clickjacking_protection(response):
+    """
+    Apply clickjacking protection to all responses
+    """
+    # Set security headers to prevent clickjacking
+    # Call refresh_security_headers() after changing ALLOWED_SOURCES at runtime
+    response.headers.update(_FRAME_HEADERS)
     return response
 
 
+# The policy does not depend on the request, so the header value is built once
+CONTENT_SECURITY_POLICY = (
+    "default-src 'self'; "
+    "script-src 'self' "
+    "https://cdnjs.cloudflare.com/ajax/libs/popper.js/1.14.7/umd/popper.min.js "
+    "https://code.jquery.com/jquery-3.3.1.slim.min.js "
+    "https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/js/bootstrap.bundle.min.js; "
+    "style-src 'self' "
+    "https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/css/bootstrap.min.css; "
+    "img-src 'self'; "
+    "font-src 'self' "
+    "https://fonts.gstatic.com/s/oswald/v53/"
+    "TK3_WkUHHAIjg75cFRf3bXL8LICs1_FvsUZiZQ.woff2; "
+    "frame-ancestors 'self'; "
+    "object-src 'none'; "
+    "connect-src 'self'; "
+    "base-uri 'self'; "
+    "form-action 'self';"
+)
+
+
 @app.after_request
 def apply_csp(response: Response) -> Response:
     """
@@ -405,23 +468,5 @@ def apply_csp(response: Response) -> Response:
     Returns:
     Response: The modified HTTP response with the CSP header applied.
     """
-    csp = (
-        "default-src 'self'; "
-        "script-src 'self' "
-        "https://cdnjs.cloudflare.com/ajax/libs/popper.js/1.14.7/umd/popper.min.js "
-        "https://code.jquery.com/jquery-3.3.1.slim.min.js "
-        "https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/js/bootstrap.bundle.min.js; "
-        "style-src 'self' "
-        "https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/css/bootstrap.min.css; "
-        "img-src 'self'; "
-        "font-src 'self' "
-        "https://fonts.gstatic.com/s/oswald/v53/"
-        "TK3_WkUHHAIjg75cFRf3bXL8LICs1_FvsUZiZQ.woff2; "
-        "frame-ancestors 'self'; "
-        "object-src 'none'; "
-        "connect-src 'self'; "
-        "base-uri 'self'; "
-        "form-action 'self';"
-    )
-    response.headers["Content-Security-Policy"] = csp
+    response.headers["Content-Security-Policy"] = CONTENT_SECURITY_POLICY
     return response
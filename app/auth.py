@@ -9,6 +9,13 @@ Functions:
 - `verify_token(token)`: Verifies the validity of an access token by
   communicating with Keycloak's introspection endpoint. If the token is invalid
   or expired, an appropriate HTTP error is raised.
+- `clear_token_cache()`: Forgets all cached introspection results.
+
+Token Cache:
+Introspection results of active tokens are kept in memory for a short time, so
+repeated requests with the same token skip the HTTP round-trip to Keycloak. An
+entry never outlives the `exp` claim of its token. Inactive tokens and errors are
+never cached. A token revoked in Keycloak is accepted until its entry expires.
 
 Dependencies:
 - `requests`: Used to make HTTP requests to Keycloak.
@@ -21,6 +28,9 @@ settings:
 - `KEYCLOAK_INTROSPECT_URI`: The URI of the Keycloak introspection endpoint.
 - `OIDC_CLIENT_ID`: The client ID for the application in Keycloak.
 - `OIDC_CREDENTIALS_SECRET`: The client secret for authentication.
+- `KEYCLOAK_TOKEN_CACHE_TTL`: Seconds an introspection result is cached
+  (default: 60). Set to `0` to introspect every token on every request.
+  Read from the environment variable of the same name by `create_app`.
 
 Raises:
 - `HTTP 500`: If there is an error connecting to the Keycloak server.
@@ -28,15 +38,65 @@ Raises:
 """
 
 
+import time
+
 import requests
 
 from flask import abort, current_app
 
+DEFAULT_TOKEN_CACHE_TTL = 60
+TOKEN_CACHE_SIZE = 1024
+
+# token -> (expiry timestamp, introspection result)
+_TOKEN_CACHE = {}
+
+
+def clear_token_cache():
+    """
+    Forget all cached introspection results.
+    """
+    _TOKEN_CACHE.clear()
+
+
+def _get_cached_token_data(token, now):
+    """
+    Return the cached introspection result of a token, or None.
+    """
+    cached = _TOKEN_CACHE.get(token)
+    if cached is None:
+        return None
+    if cached[0] <= now:
+        _TOKEN_CACHE.pop(token, None)
+        return None
+    return cached[1]
+
+
+def _cache_token_data(token, token_data, now, ttl):
+    """
+    Cache the introspection result of an active token for at most `ttl` seconds.
+    """
+    expires_at = now + ttl
+    exp = token_data.get("exp")
+    if isinstance(exp, (int, float)):
+        expires_at = min(expires_at, exp)
+    if expires_at <= now:
+        return
+    if len(_TOKEN_CACHE) >= TOKEN_CACHE_SIZE:
+        _TOKEN_CACHE.clear()
+    _TOKEN_CACHE[token] = (expires_at, token_data)
+
 
 def verify_token(token):
     """
     Verify the access token with Keycloak's introspection endpoint.
     """
+    ttl = current_app.config.get("KEYCLOAK_TOKEN_CACHE_TTL", DEFAULT_TOKEN_CACHE_TTL)
+    now = time.time()
+    if ttl > 0:
+        token_data = _get_cached_token_data(token, now)
+        if token_data is not None:
+            return token_data
+
     # Get the Keycloak introspection endpoint and client credentials
     introspect_url = current_app.config["KEYCLOAK_INTROSPECT_URI"]
     client_id = current_app.config["OIDC_CLIENT_ID"]
@@ -64,4 +124,6 @@ def verify_token(token):
     if not token_data.get("active", False):
         abort(401, description="Invalid or expired token")
 
+    if ttl > 0:
+        _cache_token_data(token, token_data, now, ttl)
     return token_data
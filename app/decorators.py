@@ -11,6 +11,8 @@ Decorators:
 - `set_theme`: Adds theme and portal name to the request context.
 - `set_matomo_enabled`: Enables Matomo analytics by adding relevant
   configuration to the request context.
+  Both read the settings from the app configuration (see
+  `configure_portal_settings` in `app/__init__.py`) instead of the environment.
 - `caching`: Sets cache control headers for a route.
 - `keycloak_protected`: Protects routes with Keycloak authentication.
 
@@ -25,7 +27,7 @@ import os
 
 from functools import wraps
 from flask import request, make_response, current_app, abort, jsonify
-from flask_negotiate import produces
+from werkzeug.exceptions import NotAcceptable
 
 from app.utils import is_sentry_enabled
 from app.auth import verify_token
@@ -51,10 +53,11 @@ def set_theme(f):
 
     @wraps(f)
     def decorated_function(*args, **kwargs):
+        config = current_app.config
         # Adding theme to request context
-        request.theme = os.getenv("THEME", "default")
+        request.theme = config.get("THEME", "default")
         # Adding portal name to request context
-        request.portal_name = os.getenv("PORTAL_NAME", "RIS Synergy")
+        request.portal_name = config.get("PORTAL_NAME", "RIS Synergy")
         return f(*args, **kwargs)
 
     return decorated_function
@@ -67,11 +70,12 @@ def set_matomo_enabled(f):
 
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        request.matomo_enabled = os.getenv(
+        config = current_app.config
+        request.matomo_enabled = config.get(
             "MATOMO_ENABLED", "true"
         )  # Adding matomo_enabled to request context
-        request.matomo_url = os.getenv("MATOMO_URL", "")
-        request.matomo_site_id = os.getenv("MATOMO_SITE_ID", "")
+        request.matomo_url = config.get("MATOMO_URL", "")
+        request.matomo_site_id = config.get("MATOMO_SITE_ID", "")
         return f(*args, **kwargs)
 
     return decorated_function
@@ -140,10 +144,21 @@ def conditional_produces(mime_type):
     `ENFORCE_CONTENT_NEGOTIATION` environment variable.
     """
 
+    # Built once per decorated route, not on every request
+    produced = frozenset((mime_type,))
+
     def decorator(func):
-        if ENFORCE_CONTENT_NEGOTIATION:
-            return produces(mime_type)(func)
-        return func
+        if not ENFORCE_CONTENT_NEGOTIATION:
+            return func
+
+        @wraps(func)
+        def wrapped(*args, **kwargs):
+            # Only an exact match in the Accept header is accepted, no wildcards
+            if produced.isdisjoint(request.accept_mimetypes.values()):
+                raise NotAcceptable()
+            return func(*args, **kwargs)
+
+        return wrapped
 
     return decorator
 
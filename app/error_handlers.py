@@ -20,9 +20,12 @@ Error Handlers:
 - `429`: Too Many Requests
 - `503`: Service Unavailable
 
+The messages are defined in `ERROR_MESSAGES`. The JSON body of each handler is
+serialized once at registration time, with the JSON provider of the app.
+
 Usage:
 Call `register_error_handlers(app)` during the Flask application setup process
-to enable these handlers.
+to enable these handlers. Register the JSON provider first.
 
 Dependencies:
 - `flask`: Used for defining error handlers and generating JSON responses.
@@ -33,42 +36,36 @@ Each error handler returns a JSON response with a standardized format:
 }
 """
 
-from flask import jsonify
+# Status code -> message of the JSON error response
+ERROR_MESSAGES = {
+    500: "Internal server error",
+    403: "Forbidden",
+    404: "Page not found",
+    405: "Method not allowed",
+    400: "Bad request",
+    401: "Unauthorized",
+    429: "Too many requests",
+    503: "Service unavailable",
+}
 
 
-def register_error_handlers(app):
+def _make_error_handler(app, code, message):
     """
-    Register error handlers for the application
+    Create an error handler returning a JSON body serialized once, up front.
     """
+    body = app.json.dumps({"error": f"{code} Error: {message}"}) + "\n"
 
-    @app.errorhandler(500)
-    def internal_server_error(_):
-        return jsonify(error="500 Error: Internal server error"), 500
-
-    @app.errorhandler(403)
-    def forbidden(_):
-        return jsonify(error="403 Error: Forbidden"), 403
-
-    @app.errorhandler(404)
-    def not_found(_):
-        return jsonify(error="404 Error: Page not found"), 404
+    def handle_error(_):
+        # A new response per error; after_request hooks modify its headers
+        return app.response_class(body, status=code, mimetype=app.json.mimetype)
 
-    @app.errorhandler(405)
-    def method_not_allowed(_):
-        return jsonify(error="405 Error: Method not allowed"), 405
+    handle_error.__name__ = f"handle_{code}"
+    return handle_error
 
-    @app.errorhandler(400)
-    def bad_request(_):
-        return jsonify(error="400 Error: Bad request"), 400
 
-    @app.errorhandler(401)
-    def unauthorized(_):
-        return jsonify(error="401 Error: Unauthorized"), 401
-
-    @app.errorhandler(429)
-    def too_many_requests(_):
-        return jsonify(error="429 Error: Too many requests"), 429
-
-    @app.errorhandler(503)
-    def service_unavailable(_):
-        return jsonify(error="503 Error: Service unavailable"), 503
+def register_error_handlers(app):
+    """
+    Register error handlers for the application
+    """
+    for code, message in ERROR_MESSAGES.items():
+        app.register_error_handler(code, _make_error_handler(app, code, message))
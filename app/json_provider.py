@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+Module: json_provider.py
+
+This module defines a Flask JSON provider backed by `msgspec`, whose C encoder and
+decoder are considerably faster than the standard library `json` module. It is used
+by `jsonify`, `request.get_json()` and all other JSON handling of the application.
+
+Classes:
+- `MsgspecJSONProvider`: A drop-in replacement for Flask's `DefaultJSONProvider`.
+
+Functions:
+- `register_json_provider(app)`: Installs the provider on the given Flask application.
+
+Features:
+- Honors the `sort_keys` and `compact` settings of the default provider.
+- Keys are written in insertion order by default (`sort_keys = False`), like the
+  pre-serialized documents of the `ris-synergy` blueprint; sorting every mapping
+  on every response is skipped.
+- Non-ASCII characters are written as UTF-8 instead of `\\u` escapes
+  (`ensure_ascii = False`), also by the standard library fallback. Setting
+  `ensure_ascii` on the provider switches to the escaping standard library encoder.
+- Falls back to the standard library for pretty-printed output (e.g., in debug mode),
+  for calls passing `json` specific keyword arguments and for calls asking for
+  non-compact separators or `ensure_ascii` output.
+
+Differences to the default provider:
+- `datetime` and `date` values are serialized as ISO 8601 strings (msgspec's native
+  format) instead of HTTP dates.
+
+Dependencies:
+- `msgspec`: For encoding and decoding JSON.
+
+Usage:
+Call `register_json_provider(app)` during the Flask application setup process.
+"""
+
+
+import msgspec
+
+from flask.json.provider import DefaultJSONProvider
+
+
+class MsgspecJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider that encodes and decodes with msgspec.
+    """
+
+    # Sorting keys costs a sort per mapping on every response; keep insertion order
+    sort_keys = False
+
+    # msgspec writes UTF-8; the standard library fallback (e.g., `indent`) does too
+    ensure_ascii = False
+
+    # Keyword arguments that msgspec can handle, given values matching its output
+    _SUPPORTED_DUMPS_ARGS = frozenset(("sort_keys", "separators", "ensure_ascii"))
+
+    # msgspec always writes compact separators and unescaped UTF-8
+    _COMPACT_SEPARATORS = (None, (",", ":"))
+
+    def dumps(self, obj, **kwargs):
+        """
+        Serialize data as JSON.
+        """
+        if (
+            not self._SUPPORTED_DUMPS_ARGS.issuperset(kwargs)
+            or kwargs.get("separators") not in self._COMPACT_SEPARATORS
+            or kwargs.get("ensure_ascii", self.ensure_ascii)
+        ):
+            return super().dumps(obj, **kwargs)
+        order = "sorted" if kwargs.get("sort_keys", self.sort_keys) else None
+        return msgspec.json.encode(obj, enc_hook=self.default, order=order).decode(
+            "utf-8"
+        )
+
+    def loads(self, s, **kwargs):
+        """
+        Deserialize data as JSON.
+        """
+        if kwargs:
+            return super().loads(s, **kwargs)
+        try:
+            return msgspec.json.decode(s)
+        except msgspec.DecodeError as e:
+            # Flask turns a ValueError into a 400 Bad Request response
+            raise ValueError(str(e)) from e
+
+
+def register_json_provider(app):
+    """
+    Register the msgspec JSON provider.
+    """
+    app.json = MsgspecJSONProvider(app)
@@ -103,12 +103,9 @@ def setup_stream_handler():
 def create_log_folder():
     """
     Create log folder from env variable LOG_FOLDER if it does not exist.
-    if log folder does not exist, create it
     if env variable LOG_FOLDER is not set, use the default log folder
     """
     log_folder = os.getenv("LOG_FOLDER", "logs")
-    if not os.path.exists(log_folder):
-        os.makedirs(log_folder)
-        print(f"Info: log folder {log_folder} created")
-    else:
-        print(f"Info: log folder {log_folder} exists")
+    # A single mkdir; an existing folder is not an error
+    os.makedirs(log_folder, exist_ok=True)
+    print(f"Info: using log folder {log_folder}")
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+Module: file_watcher.py
+
+This module provides an optional file system watcher for the in-memory caches of the
+`ris-synergy` blueprint. While the watcher runs, cached files are not `stat`'ed on
+every request; instead, changes reported by the operating system (inotify on Linux)
+invalidate the affected cache entries.
+
+Functions:
+- `start_file_watcher(directories, on_change)`: Starts watching the given directories
+  and calls `on_change(path)` for every changed, created, moved or deleted file.
+  Returns `True` if the watcher is running.
+- `is_watching(directory)`: Checks if changes in a directory are currently reported.
+- `watcher_generation()`: Returns a counter that is incremented on every reported
+  change; used to detect changes that happen while a file is being loaded.
+
+Environment Variables:
+- `CACHE_FILE_WATCHER`: Set to `true` to enable the watcher (default: `false`).
+
+Dependencies:
+- `watchdog` (optional, see `requirements-watchdog.txt`). Without it, or when the
+  watcher is disabled, the caches keep checking modification times on each request.
+
+Notes:
+- The watcher thread does not survive `fork()`. Its state is reset in forked child
+  processes (e.g., Gunicorn workers of a preloaded app), which fall back to checking
+  modification times until they start their own watcher.
+"""
+
+
+import logging
+import os
+
+CACHE_FILE_WATCHER_ENABLED = os.getenv("CACHE_FILE_WATCHER", "false").lower() == "true"
+
+if CACHE_FILE_WATCHER_ENABLED:
+    try:
+        from watchdog.observers import Observer
+    except ImportError:
+        logging.warning("CACHE_FILE_WATCHER is enabled, but watchdog is not installed")
+        Observer = None
+else:
+    Observer = None
+
+# Events that don't change a file
+_IGNORED_EVENT_TYPES = frozenset(("opened", "closed_no_write"))
+
+_WATCHER_STATE = {"observer": None, "directories": frozenset(), "generation": 0}
+
+
+class _CallbackHandler:
+    """
+    Watchdog event handler passing the paths of changed files to a callback.
+    """
+
+    def __init__(self, on_change):
+        self.on_change = on_change
+
+    def dispatch(self, event):
+        """
+        Handle a file system event.
+        """
+        if event.is_directory or event.event_type in _IGNORED_EVENT_TYPES:
+            return
+        _WATCHER_STATE["generation"] += 1
+        for path in (event.src_path, getattr(event, "dest_path", None)):
+            if path:
+                changed_path = os.fsdecode(path)
+                try:
+                    self.on_change(changed_path)
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    # An exception would stop the observer thread
+                    logging.error("Error handling change of %s: %s", changed_path, e)
+
+
+def start_file_watcher(directories, on_change):
+    """
+    Start watching directories for file changes.
+    """
+    if Observer is None:
+        return False
+    if _WATCHER_STATE["observer"] is not None and _WATCHER_STATE["observer"].is_alive():
+        return True
+
+    handler = _CallbackHandler(on_change)
+    observer = Observer()
+    observer.daemon = True
+    watched = set()
+    try:
+        for directory in directories:
+            if os.path.isdir(directory):
+                observer.schedule(handler, directory, recursive=False)
+                watched.add(directory)
+        observer.start()
+    except OSError as e:  # e.g., inotify watch limit reached
+        logging.error("Could not start the file watcher: %s", e)
+        return False
+
+    _WATCHER_STATE.update(observer=observer, directories=frozenset(watched))
+    logging.info("Watching %s for changes", ", ".join(sorted(watched)))
+    return True
+
+
+def is_watching(directory):
+    """
+    Check if changes in a directory are currently reported.
+    """
+    observer = _WATCHER_STATE["observer"]
+    return (
+        observer is not None
+        and directory in _WATCHER_STATE["directories"]
+        and observer.is_alive()
+    )
+
+
+def watcher_generation():
+    """
+    Return the number of changes reported so far.
+    """
+    return _WATCHER_STATE["generation"]
+
+
+def _reset_after_fork():
+    """
+    Forget the watcher of the parent process; its thread does not exist in the child.
+    """
+    _WATCHER_STATE.update(observer=None, directories=frozenset())
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+Module: openapi_specs.py
+
+This module converts the OpenAPI specification YAML files of the `ris-synergy`
+blueprint into JSON copies stored next to them. It is shared by the blueprint, which
+creates missing or outdated copies on startup, and by `scripts/precompile_specs.py`,
+which creates them at build time. It only depends on `yaml` and `msgspec`, so the
+script can load it without importing (and creating) the Flask application.
+
+Constants:
+- `SERVER_URL_PLACEHOLDER` (str): Placeholder for the server URL used in the specs.
+- `ORGUNIT_OPENAPI_SPEC`, `INFO_OPENAPI_SPEC`, `PROJECT_OPENAPI_SPEC` (str): File name
+  templates of the specs the blueprint loads; `{version}` is the supported API version.
+- `LOADED_OPENAPI_SPECS` (tuple): All of the above file name templates.
+- `YAML_LOADER`: The libyaml based loader when PyYAML was built with it.
+
+Functions:
+- `openapi_spec_file_names(api_version)`: Returns the file names of the specs the
+  blueprint loads for an API version.
+- `write_json_copy(yaml_path)`: Converts a spec into a JSON file next to it and returns
+  the path of the JSON file.
+"""
+
+
+import os
+
+import msgspec
+import yaml
+
+SERVER_URL_PLACEHOLDER = "{{SERVER_URL}}"
+# The raw placeholder is not valid YAML, so it is swapped for a plain token while parsing
+PLACEHOLDER_TOKEN = "__SERVER_URL_PLACEHOLDER__"
+
+ORGUNIT_OPENAPI_SPEC = "RIS-SYNERGY-org-unit_api-{version}-resolved.yaml"
+INFO_OPENAPI_SPEC = "RIS-SYNERGY-info-api-{version}-resolved.yaml"
+PROJECT_OPENAPI_SPEC = "RIS-SYNERGY-project-api-{version}-resolved.yaml"
+LOADED_OPENAPI_SPECS = (ORGUNIT_OPENAPI_SPEC, INFO_OPENAPI_SPEC, PROJECT_OPENAPI_SPEC)
+
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def openapi_spec_file_names(api_version):
+    """
+    Return the file names of the OpenAPI specs the blueprint loads for an API version.
+    """
+    return tuple(spec.format(version=api_version) for spec in LOADED_OPENAPI_SPECS)
+
+
+def write_json_copy(yaml_path):
+    """
+    Convert an OpenAPI YAML file into a JSON file next to it.
+    The server URL placeholder is kept, so the copy can be processed like the original.
+    Raises `yaml.YAMLError`, `msgspec.EncodeError` or `OSError` on failure.
+    """
+    json_path = os.path.splitext(yaml_path)[0] + ".json"
+
+    with open(yaml_path, "r", encoding="utf-8") as f:
+        content = f.read().replace(SERVER_URL_PLACEHOLDER, PLACEHOLDER_TOKEN)
+    data = yaml.load(content, Loader=YAML_LOADER)  # nosec B506
+    # Encoded straight to compact UTF-8 bytes; no intermediate str is built
+    json_content = msgspec.json.encode(data).replace(
+        PLACEHOLDER_TOKEN.encode(), SERVER_URL_PLACEHOLDER.encode()
+    )
+
+    # Write to a temporary file first so concurrent workers never read a partial copy
+    tmp_path = f"{json_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(json_content)
+    os.replace(tmp_path, json_path)
+    return json_path
@@ -8,7 +8,8 @@ downloading JSON from a URL and validating JSON data against a JSON schema.
 Functions:
 - `download_json_data(url, params={})`:
   Downloads JSON data from the specified URL using an HTTP GET request. 
-  Supports optional query parameters.
+  Supports optional query parameters. Requests share one pooled session, so
+  connections are kept alive between calls.
 
   Parameters:
     - `url` (str): The URL to fetch data from.
@@ -22,8 +23,13 @@ Functions:
     - Response status and text for debugging.
     - Errors encountered during the request.
 
+- `get_json_schema_validator(json_schema)`:
+  Returns a validator for a JSON schema. The schema is checked and the validator
+  built once; later calls with the same schema object reuse it.
+
 - `validate_json_against_json_schema(json_data, json_schema)`:
   Validates JSON data against a provided JSON schema using the `jsonschema` library.
+  Uses the cached validator from `get_json_schema_validator`.
 
   Parameters:
     - `json_data` (dict): The JSON data to validate.
@@ -38,7 +44,7 @@ Functions:
 
 Dependencies:
 - `requests`: For making HTTP GET requests.
-- `jsonschema.validate`: For validating JSON data against schemas.
+- `jsonschema`: For validating JSON data against schemas.
 
 Usage:
 This module is intended for use in applications that require JSON data validation 
@@ -59,8 +65,35 @@ Example:
 
 import requests
 
-from jsonschema import validate
-from jsonschema.exceptions import ValidationError, SchemaError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from jsonschema.exceptions import ValidationError, SchemaError, best_match
+from jsonschema.validators import validator_for
+
+# Maximum number of cached schema validators
+VALIDATOR_CACHE_SIZE = 128
+
+_VALIDATOR_CACHE = {}
+
+
+def _create_http_session():
+    """
+    Create a requests session with a connection pool and retries.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.1),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Shared session; keeps connections alive, so repeated downloads from the same host
+# skip the TCP and TLS handshakes
+_HTTP_SESSION = _create_http_session()
 
 
 def download_json_data(url, params=None):
@@ -73,7 +106,7 @@ def download_json_data(url, params=None):
         headers = {
             "Accept": "application/json",
         }
-        response = requests.get(url, headers=headers, params=params, timeout=10)
+        response = _HTTP_SESSION.get(url, headers=headers, params=params, timeout=10)
         print(f"Response: {response.status_code}")
         print(f"Response: {response.text}")
         if response.status_code == 200:
@@ -86,6 +119,26 @@ def download_json_data(url, params=None):
         return None
 
 
+def get_json_schema_validator(json_schema):
+    """
+    Return a validator for a JSON schema, checking the schema only on first use.
+    Validators are cached by the identity of the schema object, so passing the same
+    (unchanged) schema again reuses the compiled validator.
+    """
+    cached = _VALIDATOR_CACHE.get(id(json_schema))
+    # The cache keeps the schema alive, so its id cannot be reused by another object
+    if cached is not None and cached[0] is json_schema:
+        return cached[1]
+
+    validator_class = validator_for(json_schema)
+    validator_class.check_schema(json_schema)
+    validator = validator_class(json_schema)
+    if len(_VALIDATOR_CACHE) >= VALIDATOR_CACHE_SIZE:
+        _VALIDATOR_CACHE.clear()
+    _VALIDATOR_CACHE[id(json_schema)] = (json_schema, validator)
+    return validator
+
+
 def validate_json_against_json_schema(json_data, json_schema):
     """
     Validate JSON data against a JSON schema.
@@ -93,7 +146,10 @@ def validate_json_against_json_schema(json_data, json_schema):
     try:
         # validate json_data against json_schema
         print("Validating JSON data against JSON schema")
-        validate(instance=json_data, schema=json_schema)
+        validator = get_json_schema_validator(json_schema)
+        error = best_match(validator.iter_errors(json_data))
+        if error is not None:
+            raise error
         return True
     except ValidationError as e:
         print(f"Validation Error: {e}")
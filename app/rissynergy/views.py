@@ -15,6 +15,8 @@ Environment Variables:
 - `STATIC_FOLDER`: The folder containing static files.
 - `SUPPORTED_API_VERSION`: The API version to use for schema resolution (default: "1.0").
 - `OPEN_API_SERVER_URL`: The server URL to replace placeholders in schemas.
+- `CACHE_FILE_WATCHER`: Set to `true` to invalidate the caches on file change events
+  instead of checking modification times on every request (requires `watchdog`).
 - Various paths for schema and JSON files are dynamically constructed based on the API version.
 
 Key Functions:
@@ -38,12 +40,41 @@ Key Functions:
 Decorators:
 - `@keycloak_protected`: Secures endpoints requiring Keycloak authentication.
 - `@produces`: Ensures responses adhere to specified content types.
-- `@swag_from`: Integrates Flasgger for Swagger documentation.
+- `@swag_from`: Integrates Flasgger for Swagger documentation. Flasgger only reads files
+  with its YAML reader, hence `filetype="yml"`; JSON is valid YAML.
+
+JSON documents are decoded with `msgspec`, which parses considerably faster than the
+standard library `json` module. Its `DecodeError` is caught alongside `ValueError`.
 
 Utilities:
-- `is_valid_yaml`: Validates the structure of a YAML file.
+- `is_valid_yaml`: Validates the structure of a YAML file (memoized per file version).
 - `get_latest_json_file`: Retrieves the most recent JSON file from the `JSON_DIR`.
+- `get_cached_latest_json_file`: Same as `get_latest_json_file`, but only rescans the
+  directory when its modification time changes. Evicts the cached previous organigram
+  when a newer file replaces it.
 - `replace_placeholder_in_file`: Replaces placeholders (e.g., `{{SERVER_URL}}`) in schema files.
+- `load_cached_document`: Returns the parsed, serialized and ETag-stamped version of a schema
+  file, cached in memory until the file's modification time changes.
+- `yaml_to_json_cache`: Writes a JSON copy next to an OpenAPI YAML spec (regenerated when
+  stale) so specs are loaded with the JSON parser instead of the much slower YAML parser.
+- `_serve_cached_schema`: Shared body of the schema and info endpoints; serves a cached
+  document or a JSON `500` error.
+- `_apidocs_redirect`: Shared body of the apidocs endpoints; the redirect target is resolved
+  once per application and cached in `app.extensions`.
+- `get_orgunit_index`: Builds (once per cached organigram file) an index of serialized org
+  units by ID, used by `get_orgunit` for constant-time lookups.
+- `preload_documents`: Loads several files into the document cache concurrently.
+- `invalidate_cached_file`: Drops the cached data of a changed file (used by the optional
+  file watcher, see `app/rissynergy/file_watcher.py`).
+- `prewarm_caches`: Preloads all served documents and the org unit index; runs when the
+  blueprint is registered and in Gunicorn's `post_fork` hook, so the first request to
+  each endpoint is already warm.
+
+Caching:
+- Schema, info and organigram responses are served from an in-memory document cache.
+- The schema, info, organigram and organigram-by-date endpoints send an `ETag`,
+  `Last-Modified` and `Cache-Control` header and answer conditional requests
+  (`If-None-Match` / `If-Modified-Since`) with `304 Not Modified`.
 
 Error Handling:
 - Logs detailed errors for debugging.
@@ -59,25 +90,44 @@ Example Registration:
 """
 
 
+import hashlib
 import logging
 import json
 import os
 import re
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
 from urllib.parse import urljoin
+import msgspec
 import yaml
 
 from flask import (
     Blueprint,
+    current_app,
     redirect,
+    request,
     jsonify,
+    send_file,
     abort,
     url_for,
 )
 from flasgger import swag_from
-from werkzeug.utils import secure_filename
 
 from app.decorators import keycloak_protected, conditional_produces, enabled_endpoint
+from app.rissynergy.file_watcher import (
+    is_watching,
+    start_file_watcher,
+    watcher_generation,
+)
+from app.rissynergy.openapi_specs import (
+    INFO_OPENAPI_SPEC,
+    ORGUNIT_OPENAPI_SPEC,
+    PROJECT_OPENAPI_SPEC,
+    SERVER_URL_PLACEHOLDER,
+    YAML_LOADER,
+    write_json_copy,
+)
 
 
 static_url_path = os.getenv("STATIC_URL_PATH") or None
@@ -92,73 +142,88 @@ SUPPORTED_API_VERSION = os.getenv("SUPPORTED_API_VERSION", "1.0")
 # Environment variable for server URL
 OPEN_API_SERVER_URL = os.getenv("OPEN_API_SERVER_URL", "https://default-url.com")
 
+# Directory of this package; data and schema paths are resolved relative to it,
+# independent of the working directory the app is started from
+RISSYNERGY_DIR = os.path.dirname(os.path.abspath(__file__))
+
 # Path where the JSON files are stored
-JSON_DIR = os.path.join(os.getcwd(), "app", "rissynergy", "organigram_data")
+JSON_DIR = os.path.join(RISSYNERGY_DIR, "organigram_data")
+# Resolved once, so date lookups don't need a realpath() per request
+_RESOLVED_JSON_DIR = os.path.realpath(JSON_DIR)
+
+# Format of the date parameter of the organigram_by_date endpoint (YYYY-MM-DD)
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
 
 # Path to the OpenAPI schema JSON files
 
 RIS_SYNERGY_SCHEMA_PATH = os.path.join(
-    os.getcwd(), "app", "rissynergy", "jsonschemas", "ris-synergy.json"
+    RISSYNERGY_DIR,
+    "jsonschemas",
+    "ris-synergy.json",
 )
 
 ORGUNIT_SCHEMA_PATH = os.path.join(
-    os.getcwd(),
-    "app",
-    "rissynergy",
+    RISSYNERGY_DIR,
     "jsonschemas",
     f"RIS-SYNERGY-org-unit_api-{SUPPORTED_API_VERSION}-resolved.json",
 )
 INFO_SCHEMA_PATH = os.path.join(
-    os.getcwd(),
-    "app",
-    "rissynergy",
+    RISSYNERGY_DIR,
     "jsonschemas",
     f"RIS-SYNERGY-info-api-{SUPPORTED_API_VERSION}-resolved.json",
 )
 FUNDING_SCHEMA_PATH = os.path.join(
-    os.getcwd(),
-    "app",
-    "rissynergy",
+    RISSYNERGY_DIR,
     "jsonschemas",
     f"funding-v.{SUPPORTED_API_VERSION}.json",
 )
 PROJECT_SCHEMA_PATH = os.path.join(
-    os.getcwd(),
-    "app",
-    "rissynergy",
+    RISSYNERGY_DIR,
     "jsonschemas",
     f"RIS-SYNERGY-project-api-{SUPPORTED_API_VERSION}-resolved.json",
 )
 ORGUNIT_OPENAPI_SPEC_PATH = os.path.join(
-    os.getcwd(),
-    "app",
-    "rissynergy",
+    RISSYNERGY_DIR,
     "openapi",
-    f"RIS-SYNERGY-org-unit_api-{SUPPORTED_API_VERSION}-resolved.yaml",
+    ORGUNIT_OPENAPI_SPEC.format(version=SUPPORTED_API_VERSION),
 )
 INFO_OPENAPI_SPEC_PATH = os.path.join(
-    os.getcwd(),
-    "app",
-    "rissynergy",
+    RISSYNERGY_DIR,
     "openapi",
-    f"RIS-SYNERGY-info-api-{SUPPORTED_API_VERSION}-resolved.yaml",
+    INFO_OPENAPI_SPEC.format(version=SUPPORTED_API_VERSION),
 )
 FUNDING_OPENAPI_SPEC_PATH = os.path.join(
-    os.getcwd(),
-    "app",
-    "rissynergy",
+    RISSYNERGY_DIR,
     "openapi",
     "funding.yaml",  # Assuming this doesn't depend on version
 )
 PROJECT_OPENAPI_SPEC_PATH = os.path.join(
-    os.getcwd(),
-    "app",
-    "rissynergy",
+    RISSYNERGY_DIR,
     "openapi",
-    f"RIS-SYNERGY-project-api-{SUPPORTED_API_VERSION}-resolved.yaml",
+    PROJECT_OPENAPI_SPEC.format(version=SUPPORTED_API_VERSION),
 )
 INFO_DATA_PATH = os.path.join(
-    os.getcwd(), "app", "rissynergy", "info_data", f"info-{SUPPORTED_API_VERSION}.json"
+    RISSYNERGY_DIR,
+    "info_data",
+    f"info-{SUPPORTED_API_VERSION}.json",
+)
+
+# Max age (in seconds) clients and proxies may cache schema responses
+SCHEMA_CACHE_MAX_AGE = 3600
+
+# In-memory cache of processed schema files, keyed by file path
+_SCHEMA_CACHE = {}
+
+# Latest organigram file name, valid while JSON_DIR keeps the same modification time
+_LATEST_FILE_CACHE = {"dir": None, "mtime_ns": None, "file": None}
+
+# Files loaded into the document cache by `prewarm_caches`
+PRELOADED_DOCUMENT_PATHS = (
+    RIS_SYNERGY_SCHEMA_PATH,
+    INFO_SCHEMA_PATH,
+    ORGUNIT_SCHEMA_PATH,
+    PROJECT_SCHEMA_PATH,
+    INFO_DATA_PATH,
 )
 
 
@@ -170,14 +235,76 @@ blueprint = Blueprint(
     static_folder=static_folder,
 )
 
+# Key in `app.extensions` under which the resolved apidocs redirect targets are kept
+APIDOCS_URLS_EXTENSION = "ris-synergy.apidocs_urls"
+
+
+@blueprint.record_once
+def init_apidocs_urls(state):
+    """
+    Give each application its own cache of apidocs redirect targets.
+    """
+    state.app.extensions[APIDOCS_URLS_EXTENSION] = {}
+
+
+def yaml_to_json_cache(yaml_path):
+    """
+    Write a JSON copy of an OpenAPI YAML file next to it and return the copy's path.
+    The copy is only regenerated if it is missing or older than the YAML file. The
+    server URL placeholder is kept, so the copy can be processed like the original.
+    Returns the YAML path if the copy cannot be created.
+    """
+    json_path = os.path.splitext(yaml_path)[0] + ".json"
+    try:
+        if os.path.exists(json_path) and os.path.getmtime(
+            json_path
+        ) >= os.path.getmtime(yaml_path):
+            return json_path
+
+        write_json_copy(yaml_path)
+        logging.debug("Generated JSON copy of %s", yaml_path)
+        return json_path
+    except (yaml.YAMLError, msgspec.EncodeError, TypeError, ValueError, OSError) as e:
+        logging.error("Could not create JSON copy of %s: %s", yaml_path, e)
+        return yaml_path
+
+
+# Load the OpenAPI specs from their JSON copies
+ORGUNIT_OPENAPI_SPEC_PATH = yaml_to_json_cache(ORGUNIT_OPENAPI_SPEC_PATH)
+INFO_OPENAPI_SPEC_PATH = yaml_to_json_cache(INFO_OPENAPI_SPEC_PATH)
+PROJECT_OPENAPI_SPEC_PATH = yaml_to_json_cache(PROJECT_OPENAPI_SPEC_PATH)
+
 
 def is_valid_yaml(file_path):
     """
     Check if a file contains valid YAML.
+    The result is memoized until the modification time of the file changes.
     """
     try:
-        with open(file_path, "r", encoding="utf-8") as file:
-            yaml.safe_load(file)  # Try to parse the YAML file
+        mtime_ns = os.stat(file_path).st_mtime_ns
+    except OSError:
+        return _check_yaml(file_path)
+    return _check_yaml_version(file_path, mtime_ns)
+
+
+@lru_cache(maxsize=128)
+def _check_yaml_version(file_path, mtime_ns):  # pylint: disable=unused-argument
+    """
+    Memoized `_check_yaml`; `mtime_ns` is part of the cache key only.
+    """
+    return _check_yaml(file_path)
+
+
+def _check_yaml(file_path):
+    """
+    Parse a file to check if it contains valid YAML.
+    """
+    try:
+        with open(file_path, "rb") as file:
+            # Only run the parser; the events are discarded without building
+            # Python objects from them
+            for _ in yaml.parse(file, Loader=YAML_LOADER):  # nosec B506
+                pass
         return True
     except yaml.YAMLError as e:
         logging.error("Invalid YAML in %s: %s", file_path, e)
@@ -192,15 +319,22 @@ def get_latest_json_file():
     Get the latest JSON file in the JSON_DIR directory.
     """
     try:
-        files = [
-            f
-            for f in os.listdir(JSON_DIR)
-            if f.startswith("organigram_") and f.endswith(".json")
-        ]
-        files.sort(reverse=True)
-        if not files:
+        # scandir provides the entry types without stat() calls; the file names
+        # sort by date, so the latest one is the maximum
+        with os.scandir(JSON_DIR) as entries:
+            latest = max(
+                (
+                    entry.name
+                    for entry in entries
+                    if entry.name.startswith("organigram_")
+                    and entry.name.endswith(".json")
+                    and entry.is_file()
+                ),
+                default=None,
+            )
+        if latest is None:
             raise FileNotFoundError("No JSON files found.")
-        return files[0]
+        return latest
     except FileNotFoundError as e:
         logging.error("No JSON files found or directory missing: %s", e)
         return None
@@ -212,24 +346,62 @@ def get_latest_json_file():
         return None
 
 
+def get_cached_latest_json_file():
+    """
+    Get the latest JSON file in the JSON_DIR directory, rescanning only on changes.
+
+    Adding, removing or renaming a file updates the modification time of the
+    directory, so the result of `get_latest_json_file` is reused until it changes.
+    """
+    cached = _LATEST_FILE_CACHE
+    # While the file watcher reports changes, a valid entry needs no stat() check
+    if (
+        cached["dir"] == JSON_DIR
+        and cached["mtime_ns"] is not None
+        and is_watching(JSON_DIR)
+    ):
+        return cached["file"]
+
+    generation = watcher_generation()
+    try:
+        mtime_ns = os.stat(JSON_DIR).st_mtime_ns
+    except OSError:
+        return get_latest_json_file()
+
+    if cached["dir"] != JSON_DIR or cached["mtime_ns"] != mtime_ns:
+        previous_dir, previous_file = cached["dir"], cached["file"]
+        cached.update(dir=JSON_DIR, mtime_ns=mtime_ns, file=get_latest_json_file())
+        if previous_file and (previous_dir, previous_file) != (
+            JSON_DIR,
+            cached["file"],
+        ):
+            # Only the latest organigram is served from the cache; drop the outdated one
+            evict_cached_document(os.path.join(previous_dir, previous_file))
+        if generation != watcher_generation():
+            # Changed while scanning; check again on the next call
+            cached["mtime_ns"] = None
+    return cached["file"]
+
+
 def replace_placeholder_in_file(
-    file_path, placeholder="{{SERVER_URL}}", replacement=OPEN_API_SERVER_URL
+    file_path, placeholder=SERVER_URL_PLACEHOLDER, replacement=OPEN_API_SERVER_URL
 ):
     """
     Replace a placeholder in a JSON or YAML file with the given replacement.
     """
     try:
+        # The raw text is not cached; the parsed result is kept by load_cached_document
         with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
-        content = content.replace(placeholder, replacement)
+            content = f.read().replace(placeholder, replacement)
         if file_path.endswith(".json"):
-            return json.loads(content)
+            return msgspec.json.decode(content)
         if file_path.endswith(".yaml") or file_path.endswith(".yml"):
-            return yaml.safe_load(content)
+            return yaml.load(content, Loader=YAML_LOADER)  # nosec B506
         raise ValueError("Unsupported file type")
     except (
         FileNotFoundError,
         json.JSONDecodeError,
+        msgspec.DecodeError,
         yaml.YAMLError,
         ValueError,
         OSError,
@@ -238,6 +410,177 @@ def replace_placeholder_in_file(
         return None
 
 
+def load_cached_document(file_path):
+    """
+    Load a JSON or YAML file with placeholders replaced and return a cache entry.
+
+    The entry holds the parsed data, the serialized JSON body and its ETag. Entries
+    are reused until the modification time of the file changes, or, while the file
+    watcher runs, until a change of the file is reported. Files that cannot be
+    stat'ed are processed on every call and never cached.
+    """
+    entry = _SCHEMA_CACHE.get(file_path)
+    # While the file watcher reports changes, a cached entry needs no stat() check
+    if entry is not None and is_watching(os.path.dirname(file_path)):
+        return entry
+
+    generation = watcher_generation()
+    try:
+        mtime_ns = os.stat(file_path).st_mtime_ns
+    except OSError:
+        mtime_ns = None
+
+    if entry is not None and mtime_ns is not None and entry["mtime_ns"] == mtime_ns:
+        return entry
+
+    data = replace_placeholder_in_file(file_path)
+    if data is None:
+        return None
+
+    # Serialized once per file version; compact UTF-8 output, no ASCII escaping
+    body = msgspec.json.encode(data)
+    entry = {
+        "mtime_ns": mtime_ns,
+        "data": data,
+        "body": body,
+        "etag": hashlib.blake2b(body, digest_size=16).hexdigest(),
+        "last_modified": (
+            datetime.fromtimestamp(mtime_ns / 1e9, tz=timezone.utc)
+            if mtime_ns is not None
+            else None
+        ),
+    }
+    # Don't cache what may already be outdated by a change reported while loading
+    if mtime_ns is not None and generation == watcher_generation():
+        _SCHEMA_CACHE[file_path] = entry
+    return entry
+
+
+def get_orgunit_index(entry):
+    """
+    Return a mapping of org unit ID to serialized org unit for a cached organigram.
+    The index is built on first use and stored in the cache entry, so it lives as
+    long as the cached version of the file. If IDs are duplicated, the first org unit
+    with the ID is kept.
+    """
+    index = entry.get("by_id")
+    if index is None:
+        index = {}
+        for item in entry["data"]:
+            if item["id"] not in index:
+                index[item["id"]] = msgspec.json.encode(item)
+        entry["by_id"] = index
+    return index
+
+
+def cached_json_response(entry):
+    """
+    Build a JSON response for a cache entry, honoring conditional request headers.
+    """
+    response = current_app.response_class(entry["body"], mimetype="application/json")
+    response.set_etag(entry["etag"])
+    if entry["last_modified"] is not None:
+        response.last_modified = entry["last_modified"]
+    response.cache_control.public = True
+    response.cache_control.max_age = SCHEMA_CACHE_MAX_AGE
+    # Turns the response into a bodyless 304 if the client's copy is still valid
+    return response.make_conditional(request)
+
+
+def preload_documents(paths):
+    """
+    Load the given files into the document cache concurrently.
+    File reads and the C parsers release the GIL, so the wall-clock time is
+    roughly that of the slowest file instead of the sum of all files.
+    """
+    if not paths:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+        return dict(zip(paths, executor.map(load_cached_document, paths)))
+
+
+def _serve_cached_schema(path, abort_on_error=False):
+    """
+    Serve a cached document as a conditional JSON response.
+    If the document cannot be loaded, return a JSON 500 error, or with
+    `abort_on_error` abort with 500 so the application's error handler answers.
+    """
+    try:
+        entry = load_cached_document(path)
+    except (ValueError, OSError, yaml.YAMLError) as e:
+        logging.error("Error fetching JSON document %s: %s", path, e)
+        entry = None
+    if entry is None:
+        if abort_on_error:
+            abort(500, description="Internal server error")
+        return jsonify({"error": "Internal server error"}), 500
+    return cached_json_response(entry)
+
+
+def _apidocs_redirect(endpoint):
+    """
+    Redirect to the Swagger UI with the URL of the given schema endpoint pre-filled.
+    The target is resolved on the first request and reused for the app's lifetime.
+    """
+    urls = current_app.extensions[APIDOCS_URLS_EXTENSION]
+    target = urls.get(endpoint)
+    if target is None:
+        schema_url = urljoin(OPEN_API_SERVER_URL, url_for(endpoint))
+        target = urls[endpoint] = f"/apidocs?url={schema_url}"
+    return redirect(target)
+
+
+def evict_cached_document(file_path):
+    """
+    Drop the cached document of a file.
+    """
+    _SCHEMA_CACHE.pop(file_path, None)
+
+
+def invalidate_cached_file(file_path):
+    """
+    Drop all cached data of a file; called by the file watcher when the file changes.
+    """
+    evict_cached_document(file_path)
+    if os.path.dirname(file_path) == _LATEST_FILE_CACHE["dir"]:
+        _LATEST_FILE_CACHE["mtime_ns"] = None
+
+
+def prewarm_caches():
+    """
+    Load the schema, info, OpenAPI spec and latest organigram files into the
+    document cache and build the org unit index, so no request pays the parse cost.
+    """
+    paths = PRELOADED_DOCUMENT_PATHS + (ORGUNIT_OPENAPI_SPEC_PATH,)
+    latest_file = get_cached_latest_json_file()
+    organigram_path = os.path.join(JSON_DIR, latest_file) if latest_file else None
+    if organigram_path:
+        paths += (organigram_path,)
+
+    entries = preload_documents(paths)
+
+    organigram_entry = entries.get(organigram_path)
+    if organigram_entry is not None:
+        try:
+            get_orgunit_index(organigram_entry)
+        except (KeyError, TypeError) as e:
+            logging.error("Invalid organigram data in %s: %s", organigram_path, e)
+
+
+@blueprint.record_once
+def prewarm_caches_on_register(state):  # pylint: disable=unused-argument
+    """
+    Warm the caches when the blueprint is registered on the first application, and
+    start the file watcher if it is enabled.
+    """
+    watched_paths = PRELOADED_DOCUMENT_PATHS + (ORGUNIT_OPENAPI_SPEC_PATH,)
+    start_file_watcher(
+        {JSON_DIR, *(os.path.dirname(path) for path in watched_paths)},
+        invalidate_cached_file,
+    )
+    prewarm_caches()
+
+
 @blueprint.route("/ris-synergy/ris_synergy.json", methods=["GET"])
 @conditional_produces("application/json")
 def get_ris_synergy_schema():
@@ -245,14 +588,7 @@ def get_ris_synergy_schema():
     Get RIS Synergy JSON Schema
     This endpoint serves the JSON schema for the RIS Synergy endpoint.
     """
-    try:
-        schema = replace_placeholder_in_file(RIS_SYNERGY_SCHEMA_PATH)
-        if schema is None:
-            return jsonify({"error": "Internal server error"}), 500
-        return jsonify(schema)
-    except (FileNotFoundError, ValueError, json.JSONDecodeError) as e:
-        logging.error("Error fetching JSON schema: %s", e)
-        return jsonify({"error": "Internal server error"}), 500
+    return _serve_cached_schema(RIS_SYNERGY_SCHEMA_PATH)
 
 
 @blueprint.route("/ris-synergy/v1/info/schema", methods=["GET"])
@@ -262,31 +598,22 @@ def get_info_schema():
     Get Info JSON Schema
     Dynamically replaces placeholders with configured values.
     """
-    try:
-        schema = replace_placeholder_in_file(INFO_SCHEMA_PATH)
-        if schema is None:
-            return jsonify({"error": "Internal server error"}), 500
-        return jsonify(schema)
-    except (FileNotFoundError, ValueError, json.JSONDecodeError, yaml.YAMLError) as e:
-        logging.error("Error fetching JSON schema: %s", e)
-        return jsonify({"error": "Internal server error"}), 500
+    return _serve_cached_schema(INFO_SCHEMA_PATH)
 
 
 @blueprint.route("/ris-synergy/apidocs/info", methods=["GET"])
-@swag_from(INFO_OPENAPI_SPEC_PATH)
+@swag_from(INFO_OPENAPI_SPEC_PATH, filetype="yml")
 def show_info_schema_apidocs():
     """
     Redirect to the Swagger UI with the search field pre-filled for info schema.
     """
-    # Use url_for to dynamically build the path to the schema endpoint
-    schema_url = urljoin(OPEN_API_SERVER_URL, url_for("ris-synergy.get_info_schema"))
-    # Redirect to the Flasgger documentation UI with the schema URL as a query parameter
-    return redirect(f"/apidocs?url={schema_url}")
+    return _apidocs_redirect("ris-synergy.get_info_schema")
 
 
 @blueprint.route("/ris-synergy/v1/info", methods=["GET"], endpoint="info")
 @swag_from(
     INFO_OPENAPI_SPEC_PATH,
+    filetype="yml",
     endpoint="ris-synergy.info",
     methods=["GET"],
 )
@@ -295,14 +622,7 @@ def get_info():
     """
     This endpoint serves the info data.
     """
-    try:
-        data = replace_placeholder_in_file(INFO_DATA_PATH)
-        if data is None:
-            return abort(500, description="Internal server error")
-        return jsonify(data)
-    except (FileNotFoundError, ValueError, json.JSONDecodeError, yaml.YAMLError) as e:
-        logging.error("Error fetching info data: %s", e)
-        return abort(500, description="Internal server error")
+    return _serve_cached_schema(INFO_DATA_PATH, abort_on_error=True)
 
 
 @blueprint.route("/ris-synergy/v1/orgUnits/schema", methods=["GET"])
@@ -313,27 +633,17 @@ def get_orgunit_schema():
     Get OrgUnit JSON Schema
     This endpoint serves the JSON schema for organizational units.
     """
-    try:
-        schema = replace_placeholder_in_file(ORGUNIT_SCHEMA_PATH)
-        if schema is None:
-            return abort(500, description="Internal server error")
-        return jsonify(schema)
-    except (FileNotFoundError, ValueError, json.JSONDecodeError, yaml.YAMLError) as e:
-        logging.error("Error fetching JSON schema: %s", e)
-        return abort(500, description="Internal server error")
+    return _serve_cached_schema(ORGUNIT_SCHEMA_PATH, abort_on_error=True)
 
 
 @blueprint.route("/ris-synergy/apidocs/orgunit", methods=["GET"])
 @enabled_endpoint("orgunit")
-@swag_from(ORGUNIT_OPENAPI_SPEC_PATH)
+@swag_from(ORGUNIT_OPENAPI_SPEC_PATH, filetype="yml")
 def show_orgunits_schema_apidocs():
     """
     Redirect to the Swagger UI with the search field pre-filled for orgunit schema.
     """
-    # Use url_for to dynamically build the path to the schema endpoint
-    schema_url = urljoin(OPEN_API_SERVER_URL, url_for("ris-synergy.get_orgunit_schema"))
-    # Redirect to the Flasgger documentation UI with the schema URL as a query parameter
-    return redirect(f"/apidocs?url={schema_url}")
+    return _apidocs_redirect("ris-synergy.get_orgunit_schema")
 
 
 @blueprint.route(
@@ -341,6 +651,7 @@ def show_orgunits_schema_apidocs():
 )
 @swag_from(
     ORGUNIT_OPENAPI_SPEC_PATH,
+    filetype="yml",
     endpoint="ris-synergy.organigram",
     methods=["GET"],
 )
@@ -353,8 +664,8 @@ def get_organigram():
     This endpoint serves the organizational tree of the university.
     """
     try:
-        # Replace placeholder in OpenAPI spec file
-        openapi_spec = replace_placeholder_in_file(ORGUNIT_OPENAPI_SPEC_PATH)
+        # Load the OpenAPI spec file with placeholders replaced (cached after first use)
+        openapi_spec = load_cached_document(ORGUNIT_OPENAPI_SPEC_PATH)
         if openapi_spec is None:
             logging.error(
                 "Failed to load or replace placeholders in OpenAPI spec file: %s",
@@ -363,20 +674,19 @@ def get_organigram():
             raise ValueError("Failed to process OpenAPI spec file.")
 
         # Log the loaded OpenAPI spec for debugging (optional)
-        logging.debug("Processed OpenAPI Spec: %s", openapi_spec)
+        logging.debug("Processed OpenAPI Spec: %s", openapi_spec["data"])
 
         # Fetch the latest organigram data
-        latest_file = get_latest_json_file()
+        latest_file = get_cached_latest_json_file()
         logging.debug("Latest organigram data file: %s", latest_file)
         if not latest_file:
             raise FileNotFoundError("No organigram data available.")
 
-        # Load the organigram data
-        with open(
-            os.path.join(JSON_DIR, latest_file), "r", encoding="utf-8"
-        ) as json_file:
-            data = json.load(json_file)
-            return jsonify(data)
+        # Serve the organigram data from the document cache
+        entry = load_cached_document(os.path.join(JSON_DIR, latest_file))
+        if entry is None:
+            raise ValueError(f"Failed to load organigram data file {latest_file}.")
+        return cached_json_response(entry)
 
     except (json.JSONDecodeError, FileNotFoundError, ValueError) as e:
         logging.error("Specific error: %s", e)
@@ -391,6 +701,7 @@ def get_organigram():
 )
 @swag_from(
     ORGUNIT_OPENAPI_SPEC_PATH,
+    filetype="yml",
     endpoint="ris-synergy.get_orgunit",
     methods=["GET"],
 )
@@ -404,21 +715,28 @@ def get_orgunit(orgunit_id):
     """
     try:
         # Fetch the latest organigram data
-        latest_file = get_latest_json_file()
+        latest_file = get_cached_latest_json_file()
         if not latest_file:
             raise FileNotFoundError("No organigram data available.")
 
-        with open(
-            os.path.join(JSON_DIR, latest_file), "r", encoding="utf-8"
-        ) as json_file:
-            data = json.load(json_file)
-            # Filter the data to find the org unit with the given ID
-            org_unit = next((item for item in data if item["id"] == orgunit_id), None)
-            if not org_unit:
-                raise ValueError(f"OrgUnit with ID {orgunit_id} not found.")
-            return jsonify(org_unit)
+        entry = load_cached_document(os.path.join(JSON_DIR, latest_file))
+        if entry is None:
+            raise ValueError(f"Failed to load organigram data file {latest_file}.")
 
-    except (json.JSONDecodeError, FileNotFoundError, ValueError) as e:
+        # Look up the serialized org unit in the ID index of the data file
+        org_unit = get_orgunit_index(entry).get(orgunit_id)
+        if org_unit is None:
+            logging.info("OrgUnit with ID %s not found.", orgunit_id)
+            return abort(404)
+        return current_app.response_class(org_unit, mimetype="application/json")
+
+    except (
+        json.JSONDecodeError,
+        FileNotFoundError,
+        ValueError,
+        KeyError,
+        TypeError,
+    ) as e:
         logging.error("Specific error: %s", e)
         return abort(500, description=f"Internal server error: {e}")
     except OSError as e:
@@ -440,34 +758,33 @@ def get_organigram_by_date(date):
     This endpoint serves the organizational tree of the university for a specific date.
     """
     try:
-        # Validate the date format (YYYY-MM-DD)
-        # Ensure the date parameter only contains valid characters
-        if not re.match(r"^\d{4}-\d{2}-\d{2}$", date):
+        # Validate the date format (YYYY-MM-DD); this also rules out path separators.
+        # The cheap length and separator checks reject most malformed input before
+        # the regex engine runs.
+        if (
+            len(date) != 10
+            or date[4] != "-"
+            or date[7] != "-"
+            or not _DATE_RE.fullmatch(date)
+        ):
             raise ValueError("Invalid date format. Use YYYY-MM-DD.")
 
-        # Resolve the JSON directory path
-        base_dir = Path(JSON_DIR).resolve()
-
-        # Sanitize the filename part
-        safe_date = secure_filename(f"organigram_{date}.json")
-
-        # Construct the file path
-        file_path = os.path.normpath(base_dir / safe_date).resolve()
-
-        # Check if the resolved path is still within base_dir
-        if not str(file_path).startswith(str(base_dir)):
-            raise ValueError("Invalid date input.")
+        file_path = os.path.join(_RESOLVED_JSON_DIR, f"organigram_{date}.json")
 
         # Ensure the file exists and is accessible
-        if not file_path.is_file():
+        if not os.path.isfile(file_path):
             raise FileNotFoundError(f"No organigram data available for {date}.")
 
-        # Read and return the content of the file
-        with file_path.open("r", encoding="utf-8") as json_file:
-            data = json.load(json_file)
-            return jsonify(data)
+        # Stream the file as is; it already contains the JSON document. Past
+        # organigrams don't change, so clients may cache and revalidate them.
+        return send_file(
+            file_path,
+            mimetype="application/json",
+            conditional=True,
+            max_age=SCHEMA_CACHE_MAX_AGE,
+        )
 
-    except (json.JSONDecodeError, FileNotFoundError, ValueError, OSError) as e:
+    except (FileNotFoundError, ValueError, OSError) as e:
         logging.error("Error processing request: %s", e)
         return abort(500, description=f"Internal server error: {e}")
 
@@ -480,24 +797,14 @@ def get_project_schema():
     Get Project JSON Schema
     This endpoint serves the JSON schema for projects.
     """
-    try:
-        schema = replace_placeholder_in_file(PROJECT_SCHEMA_PATH)
-        if schema is None:
-            return abort(500, description="Internal server error")
-        return jsonify(schema)
-    except (FileNotFoundError, ValueError, json.JSONDecodeError, yaml.YAMLError) as e:
-        logging.error("Error fetching JSON schema: %s", e)
-        return abort(500, description="Internal server error")
+    return _serve_cached_schema(PROJECT_SCHEMA_PATH, abort_on_error=True)
 
 
 @blueprint.route("/ris-synergy/apidocs/project", methods=["GET"])
 @enabled_endpoint("project")
-@swag_from(PROJECT_OPENAPI_SPEC_PATH)
+@swag_from(PROJECT_OPENAPI_SPEC_PATH, filetype="yml")
 def show_projects_schema_apidocs():
     """
     Redirect to the Swagger UI with the search field pre-filled for project schema.
     """
-    # Use url_for to dynamically build the path to the schema endpoint
-    schema_url =  urljoin(OPEN_API_SERVER_URL, url_for("ris-synergy.get_project_schema"))
-    # Redirect to the Flasgger documentation UI with the schema URL as a query parameter
-    return redirect(f"/apidocs?url={schema_url}")
+    return _apidocs_redirect("ris-synergy.get_project_schema")
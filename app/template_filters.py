@@ -12,16 +12,18 @@ Functions:
 - `isoformat_to_human(value, format="%B %d, %Y %H:%M")`: Converts ISO 8601 
   formatted datetime strings into a more human-readable format, with an optional
   customizable output format.
+- `format_isoformat(value, date_format)`: The memoized conversion behind
+  `isoformat_to_human`.
 
 Features:
 - Handles ISO 8601 date parsing and formatting.
-- Returns an empty string for `None` values to prevent display issues.
+- Returns an empty string for `None` and empty values to prevent display issues.
 - Gracefully falls back to the original value if parsing fails.
 
 Dependencies:
-- `datetime`: For handling date and time parsing and formatting.
-- `pytz`: For timezone handling, ensuring the datetime is correctly processed 
-  in UTC or a specific timezone as needed.
+- `datetime`: For handling date and time parsing and formatting, and for the UTC
+  timezone the parsed datetimes are attached to.
+- `functools`: For memoizing conversions of repeated values (e.g., in template loops).
 
 Usage:
 Call `register_template_filters(app)` during the Flask application setup process 
@@ -40,8 +42,27 @@ Error Handling:
 """
 
 
-import datetime
-import pytz
+from datetime import datetime, timezone
+from functools import lru_cache
+
+_UTC = timezone.utc
+
+
+@lru_cache(maxsize=4096)
+def format_isoformat(value, date_format):
+    """
+    Convert an ISO format string to the given format; memoized per (value, format).
+    """
+    # Parse the ISO format string to datetime object
+    try:
+        # If your dates are always in UTC, ensure to convert them properly
+        # to the desired timezone here
+        dt = datetime.fromisoformat(value.rstrip("Z")).replace(tzinfo=_UTC)
+        # Convert to local time or another timezone if needed, e.g.,
+        # dt.astimezone(zoneinfo.ZoneInfo("Europe/Vienna"))
+    except ValueError:
+        return value  # Return the original value if parsing fails
+    return dt.strftime(date_format)
 
 
 def register_template_filters(app):
@@ -54,17 +75,7 @@ def register_template_filters(app):
         """
         Convert ISO format string to a more readable format for use in templates.
         """
-        if value is None:
+        # None and empty strings skip the cache and the parser
+        if not value:
             return ""
-        # Parse the ISO format string to datetime object
-        try:
-            # If your dates are always in UTC, ensure to convert them properly
-            # to the desired timezone here
-            dt = datetime.datetime.fromisoformat(value.rstrip("Z")).replace(
-                tzinfo=pytz.utc
-            )
-            # Convert to local time or another timezone if needed, e.g.,
-            # dt.astimezone(pytz.timezone('Europe/Vienna'))
-        except ValueError:
-            return value  # Return the original value if parsing fails
-        return dt.strftime(date_format)
+        return format_isoformat(value, date_format)
@@ -2,16 +2,55 @@ from airflow import DAG
 from airflow.operators.dummy import DummyOperator
 from airflow.operators.python import PythonOperator
 from airflow.models import Variable
+from collections import defaultdict, deque
 from datetime import datetime, timedelta
-import json
+from functools import lru_cache
 import logging
 import os
+import msgspec
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dspace_rest_client.client import DSpaceClient
 
 # Please note:
 # This DAG requires this dspace-rest-client fork to be installed:
 # https://github.com/sszepe/dspace-rest-python
 
+# Shared value of the always empty array fields; msgspec writes tuples as JSON arrays,
+# so no new list is allocated per org unit
+EMPTY_ARRAY = ()
+
+# Fields of the org unit Solr documents used for the organigram
+SOLR_FIELDS = [
+    "search.resourceid",
+    "dc.title",
+    "dc.title.de",
+    "dc.title.en",
+    "crisou.acronym",
+    "dc.title.alternative",
+    "dc.title.alternative.en",
+    "dc.title.alternative.de",
+    "dc.title.alternative.fr",
+    "dc.title.alternative.sl",
+    "mdwrepo.orgunit.hasTopOrgUnit",
+    "mdwrepo.orgunit.hasTopOrgUnit_authority",
+    "organization.address.addressCountry",
+    "organization.address.addressLocality",
+    "risorgunit.postAddress.addrline1",
+    "risorgunit.postAddress.postCode",
+    "risorgunit.electronicAddress.telephone",
+    "risorgunit.electronicAddress.fax",
+    "risorgunit.electronicAddress.email",
+    "oairecerif.identifier.url",
+    "organization.parentOrganization",
+    "organization.parentOrganization_authority",
+    "mdwonline.validFrom",
+    "risorgunit.level",
+    "risorgunit.type",
+]
+
+
 # Define default arguments
 default_args = {
     "owner": "airflow",
@@ -20,6 +59,115 @@ default_args = {
 }
 
 
+# Mount a pooled, retrying HTTP adapter on a requests session
+def mount_http_adapter(session):
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=4,
+        max_retries=Retry(total=3, backoff_factor=0.2),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Create the DSpace client once per worker process; its REST and Solr sessions keep
+# their connections alive, so later queries skip the TCP/TLS handshake
+@lru_cache(maxsize=None)
+def get_dspace_client(api_endpoint, solr_endpoint):
+    client = DSpaceClient(
+        api_endpoint=api_endpoint,
+        unauthenticated=True,
+        fake_user_agent=True,
+        solr_endpoint=solr_endpoint,
+        solr_auth=None,
+    )
+    mount_http_adapter(client.session)
+    # pysolr creates its own session lazily; give it a pooled one up front
+    client.solr.session = mount_http_adapter(requests.Session())
+    return client
+
+
+# Page through all results of a Solr query with a cursor. Unlike start/rows paging,
+# the cost of a page does not grow with its offset, and no results are cut off.
+# The sort must end with the unique key (search.uniqueid) as a tie-breaker.
+def iter_solr_docs(solr, query, fields, sort, rows=500):
+    cursor = "*"
+    while True:
+        results = solr.search(
+            query, fl=",".join(fields), sort=sort, rows=rows, cursorMark=cursor
+        )
+        yield from results.docs
+        if not results.nextCursorMark or results.nextCursorMark == cursor:
+            break
+        cursor = results.nextCursorMark
+
+
+# Map each org unit ID to its level below the top unit (the top unit is level 1)
+def calculate_levels(docs, top_unit_id):
+    levels = {}
+    children_map = defaultdict(list)
+
+    for doc in docs:
+        doc_id = doc.get("search.resourceid")
+        parent_ids = doc.get("organization.parentOrganization_authority", [])
+
+        if not doc_id:
+            logging.warning(f"Document missing ID: {doc}")
+            continue
+
+        # The parent field holds a single ID or a list of IDs
+        if not isinstance(parent_ids, list):
+            parent_ids = [parent_ids]
+        for parent_id in parent_ids:
+            if parent_id:
+                children_map[parent_id].append(doc_id)
+
+    levels[top_unit_id] = 1
+
+    # Breadth-first traversal; a unit gets the level of its shortest path to the top
+    queue = deque([(top_unit_id, 1)])
+    while queue:
+        parent_id, current_level = queue.popleft()
+        for child_id in children_map.get(parent_id, ()):
+            if child_id in levels:
+                continue
+            levels[child_id] = current_level + 1
+            queue.append((child_id, current_level + 1))
+
+    return levels
+
+
+# Build the organigram entry of a single org unit from its Solr document
+def build_org_unit(doc, level_mapping):
+    get = doc.get  # bound once, used for every field below
+    doc_id = get("search.resourceid")
+
+    valid_from = get("mdwonline.validFrom", "")
+    if isinstance(valid_from, list):
+        valid_from = valid_from[0] if valid_from else ""
+
+    return {
+        "id": doc_id,
+        "name": [{"trans": "O", "text": get("dc.title", "")}],
+        "type": get("risorgunit.type", ""),
+        "acronym": get("crisou.acronym", ""),
+        "identifiers": EMPTY_ARRAY,
+        "address": {
+            "countryCode": get("organization.address.addressCountry", ""),
+            "addrline1": get("risorgunit.postAddress.addrline1", ""),
+            "postCode": get("risorgunit.postAddress.postCode", ""),
+            "cityTown": get("organization.address.addressLocality", ""),
+            "stateOfCountry": "Austria",
+        },
+        "electronicAddress": EMPTY_ARRAY,
+        "website": get("oairecerif.identifier.url", ""),
+        "level": f"LEVEL_{level_mapping.get(doc_id, '')}",
+        "partOf": get("organization.parentOrganization_authority", ""),
+        "startDate": f"{valid_from}T22:00:00.000+00:00" if valid_from else None,
+    }
+
+
 # Define a function to process and generate the organigram JSON
 def generate_organigram():
     # Fetch Airflow variables
@@ -27,132 +175,26 @@ def generate_organigram():
     dspace_api = Variable.get("dspace_api")
     dspace_solr = Variable.get("dspace_solr")
 
-    # Initialize the DSpace client
-    d = DSpaceClient(
-        api_endpoint=dspace_api,
-        unauthenticated=True,
-        fake_user_agent=True,
-        solr_endpoint=dspace_solr + "/search",
-        solr_auth=None,
-    )
+    # Get the (shared) DSpace client
+    d = get_dspace_client(dspace_api, dspace_solr + "/search")
 
-    # Solr query and sort parameters
+    # Fetch all org units; the unique key makes the sort order total for cursor paging
     solr_query = "entityType:OrgUnit AND organization.identifier.mdwonline:[* TO *]"
-    solr_sort = "dc.title_sort asc"
-    rows = 200
-    start = 0
-
-    # Perform the query
-    solr_search_results = d.solr_query(
-        query=solr_query,
-        filters=[],
-        fields=[
-            "search.resourceid",
-            "dc.title",
-            "dc.title.de",
-            "dc.title.en",
-            "crisou.acronym",
-            "dc.title.alternative",
-            "dc.title.alternative.en",
-            "dc.title.alternative.de",
-            "dc.title.alternative.fr",
-            "dc.title.alternative.sl",
-            "mdwrepo.orgunit.hasTopOrgUnit",
-            "mdwrepo.orgunit.hasTopOrgUnit_authority",
-            "organization.address.addressCountry",
-            "organization.address.addressLocality",
-            "risorgunit.postAddress.addrline1",
-            "risorgunit.postAddress.postCode",
-            "risorgunit.electronicAddress.telephone",
-            "risorgunit.electronicAddress.fax",
-            "risorgunit.electronicAddress.email",
-            "oairecerif.identifier.url",
-            "organization.parentOrganization",
-            "organization.parentOrganization_authority",
-            "mdwonline.validFrom",
-            "risorgunit.level",
-            "risorgunit.type",
-        ],
-        facets=[],
-        minfacests=0,
-        start=start,
-        rows=rows,
-        sort=solr_sort,
-    )
-
-    # Process the search results
-    solr_docs = solr_search_results.docs
-    output = []
+    solr_sort = "dc.title_sort asc, search.uniqueid asc"
+    solr_docs = list(iter_solr_docs(d.solr, solr_query, SOLR_FIELDS, solr_sort))
 
     top_unit_id = "37ddc68f-9cd7-4b80-b6dc-1d15a65eb34b"
 
-    def calculate_levels(docs, top_unit_id):
-        levels = {}
-        children_map = {}
-
-        for doc in docs:
-            doc_id = doc.get("search.resourceid")
-            parent_ids = doc.get("organization.parentOrganization_authority", [])
-
-            if not doc_id:
-                logging.warning(f"Document missing ID: {doc}")
-                continue
-
-            if isinstance(parent_ids, list):
-                for parent_id in parent_ids:
-                    if parent_id:
-                        children_map.setdefault(parent_id, []).append(doc_id)
-            elif parent_ids:
-                children_map.setdefault(parent_ids, []).append(doc_id)
-
-        levels[top_unit_id] = 1
-
-        def assign_levels(parent_id, current_level):
-            children = children_map.get(parent_id, [])
-            for child_id in children:
-                if child_id in levels:
-                    continue
-                levels[child_id] = current_level + 1
-                assign_levels(child_id, current_level + 1)
-
-        assign_levels(top_unit_id, 1)
-        return levels
-
     level_mapping = calculate_levels(solr_docs, top_unit_id)
 
-    for doc in solr_docs:
-        valid_from = doc.get("mdwonline.validFrom", "")
-        if isinstance(valid_from, list):
-            valid_from = valid_from[0] if valid_from else ""
-        start_date = f"{valid_from}T22:00:00.000+00:00" if valid_from else None
-
-        json_obj = {
-            "id": doc.get("search.resourceid"),
-            "name": [{"trans": "O", "text": doc.get("dc.title", "")}],
-            "type": doc.get("risorgunit.type", ""),
-            "acronym": doc.get("crisou.acronym", ""),
-            "identifiers": [],
-            "address": {
-                "countryCode": doc.get("organization.address.addressCountry", ""),
-                "addrline1": doc.get("risorgunit.postAddress.addrline1", ""),
-                "postCode": doc.get("risorgunit.postAddress.postCode", ""),
-                "cityTown": doc.get("organization.address.addressLocality", ""),
-                "stateOfCountry": "Austria",
-            },
-            "electronicAddress": [],
-            "website": doc.get("oairecerif.identifier.url", ""),
-            "level": "LEVEL_"
-            + str(level_mapping.get(doc.get("search.resourceid"), "")),
-            "partOf": doc.get("organization.parentOrganization_authority", ""),
-            "startDate": start_date,
-        }
-        output.append(json_obj)
+    output = [build_org_unit(doc, level_mapping) for doc in solr_docs]
 
     today = datetime.now().isoformat()
     output_file_name = f"{organigram_folder}/organigramm_{today[:10]}.json"
 
-    with open(output_file_name, "w", encoding="utf-8") as f:
-        json.dump(output, f, indent=4, ensure_ascii=False)
+    # msgspec writes UTF-8 without escaping, like json.dump(..., ensure_ascii=False)
+    with open(output_file_name, "wb") as f:
+        f.write(msgspec.json.format(msgspec.json.encode(output), indent=4))
 
 
 # Define the DAG
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""
+Module: gunicorn.conf.py
+
+Gunicorn configuration for running the Flask application in production. Gunicorn
+loads this file automatically when started from the repository root:
+
+    gunicorn wsgi:app
+
+Worker Model:
+- The hot endpoints serve pre-serialized responses from in-memory caches and do no
+  blocking work, so cooperative `gevent` workers are used by default. A single
+  worker process can then handle many concurrent connections.
+- Set `GUNICORN_WORKER_CLASS=sync` to fall back to the standard synchronous workers.
+- `preload_app` is left off: gevent workers must monkey-patch the standard library
+  before the application (and `requests`/`ssl`) is imported.
+
+Environment Variables:
+- `GUNICORN_BIND`: The address to bind to (default: "0.0.0.0:8000").
+- `GUNICORN_WORKERS`: The number of worker processes (default: 2).
+- `GUNICORN_WORKER_CLASS`: The worker class (default: "gevent").
+- `GUNICORN_WORKER_CONNECTIONS`: The maximum number of simultaneous connections per
+  gevent worker (default: 1000).
+- `GUNICORN_TIMEOUT`: Worker timeout in seconds (default: 30).
+
+Hooks:
+- `post_fork`: Warms the document caches of each worker (see `prewarm_caches` in
+  `app/rissynergy/views.py`).
+
+Dependencies:
+- `gunicorn` and `gevent` (see `requirements-gunicorn.txt`).
+"""
+
+
+import os
+import sys
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.getenv("GUNICORN_WORKERS", "2"))
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "gevent")
+worker_connections = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", "1000"))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "30"))
+
+
+def post_fork(server, worker):  # pylint: disable=unused-argument
+    """
+    Warm the caches of a freshly forked worker.
+
+    With `preload_app` the application was imported by the master; files that changed
+    since then are reloaded here instead of on the worker's first request. Without
+    `preload_app` the worker imports the application after this hook and the caches
+    are warmed when the blueprint is registered.
+    """
+    views = sys.modules.get("app.rissynergy.views")
+    if views is not None:
+        views.prewarm_caches()
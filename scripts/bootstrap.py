@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+"""
+Module: bootstrap.py
+
+Shared start-up for the scripts in this directory.
+
+Functions:
+- `bootstrap`: Loads the `.env` file and sets up logging. Runs once per process, so
+  scripts that import each other (or are orchestrated together) do not re-parse the
+  `.env` file or add duplicate log handlers.
+"""
+
+import logging
+from functools import cache
+
+from dotenv import load_dotenv
+
+
+@cache
+def bootstrap():
+    """
+    Loads environment variables from the `.env` file and configures logging at the
+    INFO level. Subsequent calls do nothing.
+    """
+    logging.basicConfig(level=logging.INFO)
+    load_dotenv(override=True)
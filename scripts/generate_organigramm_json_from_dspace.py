@@ -9,11 +9,11 @@ or data pipelines.
 Modules Used:
 -------------
 - `os`: Access environment variables and file paths.
-- `json`: Serialize and deserialize JSON data.
+- `msgspec`: Serialize the output as JSON.
 - `logging`: Provide logging capabilities for debugging and error reporting.
 - `re`: Regular expressions for string parsing.
 - `sys`: Exit the program on critical errors.
-- `dotenv.load_dotenv`: Load environment variables from a `.env` file.
+- `bootstrap.bootstrap`: Load environment variables from a `.env` file and set up logging.
 - `dspace_rest_client.DSpaceClient`: Interface with the DSpace REST API.
 - `datetime.datetime`: Get the current date for output file naming.
 
@@ -58,6 +58,9 @@ Functions:
 - `parse_address(address)`: Parse a string or list representing an address to extract structured components.
 - `calculate_levels(docs, top_unit_id)`: Calculate the `risorgunit.level` for each document based on the hierarchy (partof).
 - `get_text_field(value)`: Normalize a value to a single string.
+- `build_org_unit(doc, level_mapping)`: Build the organigram entry of a single org unit.
+- `iter_solr_docs(solr, query, fields, sort, rows)`: Page through all results of a Solr query.
+- `mount_http_adapter(session)`: Configure connection pooling and retries for a session.
 
 Usage:
 ------
@@ -75,6 +78,8 @@ Dependencies:
 Ensure the following Python packages are installed:
 - `python-dotenv`
 - `dspace-rest-client`
+- `requests`
+- `msgspec`
 
 Author:
 -------
@@ -83,20 +88,22 @@ Stefan Szepe, University of MUsic and Performing Arts Vienna (szepe@mdw.ac.at)
 """
 
 import datetime
+from collections import defaultdict, deque
 import os
-import json
 import logging
 import re
 import sys
 
-from dotenv import load_dotenv
+import msgspec
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dspace_rest_client.client import DSpaceClient
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+from bootstrap import bootstrap
 
-# Load environment variables from .env file
-load_dotenv(override=True)
+# Set up logging and load environment variables from .env file
+bootstrap()
 
 url = os.getenv("DSPACE_API_ENDPOINT")
 username = os.getenv("DSPACE_API_USERNAME")
@@ -110,6 +117,57 @@ if not url or not username or not password:
 else:
     logging.info(f"Connecting to DSpace API at {url} as {username}")
 
+# Regular expression to extract parts of an address: "Street Address, PostCode City"
+_ADDRESS_RE = re.compile(r"(.+),\s*(\d+)\s*(.+)")
+
+# Shared value of the always empty array fields; msgspec writes tuples as JSON arrays,
+# so no new list is allocated per org unit
+EMPTY_ARRAY = ()
+
+# Fields of the org unit Solr documents used for the organigram
+SOLR_FIELDS = [
+    "search.resourceid",
+    "dc.title",
+    "dc.title.de",
+    "dc.title.en",
+    "crisou.acronym",
+    "dc.title.alternative",
+    "dc.title.alternative.en",
+    "dc.title.alternative.de",
+    "dc.title.alternative.fr",
+    "dc.title.alternative.sl",
+    "mdwrepo.orgunit.hasTopOrgUnit",
+    "mdwrepo.orgunit.hasTopOrgUnit_authority",
+    "organization.address.addressCountry",
+    "organization.address.addressLocality",
+    "risorgunit.postAddress.addrline1",
+    "risorgunit.postAddress.postCode",
+    "risorgunit.electronicAddress.telephone",
+    "risorgunit.electronicAddress.fax",
+    "risorgunit.electronicAddress.email",
+    "oairecerif.identifier.url",
+    "organization.parentOrganization",
+    "organization.parentOrganization_authority",
+    "mdwonline.validFrom",
+    "risorgunit.level",
+    "risorgunit.type",
+]
+
+# Alternative title fields and their languages
+ALT_TITLE_FIELDS = (
+    ("dc.title.alternative.de", "de"),
+    ("dc.title.alternative.en", "en"),
+    ("dc.title.alternative.fr", "fr"),
+    ("dc.title.alternative.sl", "sl"),
+)
+
+# Mapping of SOLR contact fields to their prefixes
+CONTACT_FIELDS = (
+    ("risorgunit.electronicAddress.email", "email:"),
+    ("risorgunit.electronicAddress.telephone", "tel:"),
+    ("risorgunit.electronicAddress.fax", "fax:"),
+)
+
 
 # Function to process address
 def parse_address(address):
@@ -125,8 +183,7 @@ def parse_address(address):
     if not isinstance(address, str):
         return {"addrline1": [], "postCode": [], "cityTown": []}
 
-    # Regular expression to extract parts of the address
-    match = re.match(r"(.+),\s*(\d+)\s*(.+)", address)
+    match = _ADDRESS_RE.match(address)
     if match:
         addrline1, post_code, city_town = match.groups()
         return {
@@ -153,7 +210,7 @@ def calculate_levels(docs, top_unit_id):
         dict: A mapping of document `id` to its calculated `level`.
     """
     levels = {}
-    children_map = {}
+    children_map = defaultdict(list)
 
     # Create a map of parent -> children
     for doc in docs:
@@ -164,31 +221,30 @@ def calculate_levels(docs, top_unit_id):
             logging.warning(f"Document missing ID: {doc}")
             continue
 
-        # If parent IDs are a list, iterate; otherwise, handle as single value
-        if isinstance(parent_ids, list):
-            for parent_id in parent_ids:
-                if parent_id:
-                    children_map.setdefault(parent_id, []).append(doc_id)
-        elif parent_ids:
-            children_map.setdefault(parent_ids, []).append(doc_id)
+        # The parent field holds a single ID or a list of IDs
+        if not isinstance(parent_ids, list):
+            parent_ids = (parent_ids,)
+        for parent_id in parent_ids:
+            if parent_id:
+                children_map[parent_id].append(doc_id)
 
     # Assign LEVEL_1 to the specified top unit
     levels[top_unit_id] = 1
 
-    # Recursive function to assign levels
-    def assign_levels(parent_id, current_level):
-        children = children_map.get(parent_id, [])
-        for child_id in children:
+    # Breadth-first traversal from the specified top unit; iterative, so deep
+    # hierarchies cannot hit the recursion limit
+    queue = deque([(top_unit_id, 1)])
+    while queue:
+        parent_id, current_level = queue.popleft()
+        for child_id in children_map.get(parent_id, ()):
             if child_id in levels:
                 continue  # Avoid reassigning level
             levels[child_id] = current_level + 1
-            assign_levels(child_id, current_level + 1)
-
-    # Start the hierarchy from the specified top unit
-    assign_levels(top_unit_id, 1)
+            queue.append((child_id, current_level + 1))
 
-    # Debug: Log the levels mapping
-    logging.debug(f"Levels Mapping: {json.dumps(levels, indent=4)}")
+    # Debug: Log the levels mapping (only serialized if DEBUG is enabled)
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug("Levels Mapping: %s", msgspec.json.encode(levels).decode("utf-8"))
 
     return levels
 
@@ -209,88 +265,30 @@ def get_text_field(value):
     return value
 
 
-# Initialize the DSpace client
-d = DSpaceClient(
-    api_endpoint=os.getenv("DSPACE_REST_API_URL"),
-    unauthenticated=True,
-    fake_user_agent=True,
-    solr_endpoint=os.getenv("SOLR_ENDPOINT") + "/search",
-    solr_auth=None,
-)
-
-# Query and sort parameters
-solr_query = "entityType:OrgUnit AND organization.identifier.mdwonline:[* TO *]"
-sort_order = "asc"  # Change to "desc" if needed
-solr_sort = f"dc.title_sort {sort_order}"
-rows = 200
-start = 0  # Start position for querying
-
-# Perform the query
-solr_search_results = d.solr_query(
-    query=solr_query,
-    filters=[],
-    fields=[
-        "search.resourceid",
-        "dc.title",
-        "dc.title.de",
-        "dc.title.en",
-        "crisou.acronym",
-        "dc.title.alternative",
-        "dc.title.alternative.en",
-        "dc.title.alternative.de",
-        "dc.title.alternative.fr",
-        "dc.title.alternative.sl",
-        "mdwrepo.orgunit.hasTopOrgUnit",
-        "mdwrepo.orgunit.hasTopOrgUnit_authority",
-        "organization.address.addressCountry",
-        "organization.address.addressLocality",
-        "risorgunit.postAddress.addrline1",
-        "risorgunit.postAddress.postCode",
-        "risorgunit.electronicAddress.telephone",
-        "risorgunit.electronicAddress.fax",
-        "risorgunit.electronicAddress.email",
-        "oairecerif.identifier.url",
-        "organization.parentOrganization",
-        "organization.parentOrganization_authority",
-        "mdwonline.validFrom",
-        "risorgunit.level",
-        "risorgunit.type",
-    ],
-    facets=[],
-    minfacests=0,
-    start=start,
-    rows=rows,
-    sort=solr_sort,
-)
-
-# Process the search results
-solr_docs = solr_search_results.docs
-output = []
-
-# ID of the top-level organization
-top_unit_id = "37ddc68f-9cd7-4b80-b6dc-1d15a65eb34b"
+def build_org_unit(doc, level_mapping):
+    """
+    Build the organigram entry of a single org unit from its Solr document.
 
-# Calculate the levels for all documents
-level_mapping = calculate_levels(solr_docs, top_unit_id)
+    Args:
+        doc (dict): The Solr document of the org unit.
+        level_mapping (dict): Mapping of document `id` to its calculated level.
 
-for doc in solr_docs:
-    valid_from = doc.get("mdwonline.validFrom", "")  # Get the value of validFrom
+    Returns:
+        dict: The organigram entry.
+    """
+    get = doc.get
+    valid_from = get("mdwonline.validFrom", "")  # Get the value of validFrom
 
     # Check if valid_from is not None and not empty
     if isinstance(valid_from, list):
         valid_from = valid_from[0] if valid_from else ""
     start_date = f"{valid_from}T22:00:00.000+00:00" if valid_from else None
 
-    # Parse the address
-    full_address = doc.get("organization.address.addressLocality", "")
-    parsed_address = parse_address(full_address)
-
     # Prepare the name field
     name_field = []
 
-    # Track whether a main title or alternative titles have been added
+    # Track whether a main title has been added
     main_title_added = False
-    alt_titles_added = False
 
     # Handle the main title (dc.title)
     if "dc.title.de" in doc:
@@ -305,24 +303,18 @@ for doc in solr_docs:
         main_title_added = True
     else:
         name_field.append(
-            {"trans": "O", "text": get_text_field(doc.get("dc.title", ""))}
+            {"trans": "O", "text": get_text_field(get("dc.title", ""))}
         )
         main_title_added = True
 
-    # Handle alternative titles (dc.title.alternative)
-    alt_titles = [
-        ("dc.title.alternative.de", "de"),
-        ("dc.title.alternative.en", "en"),
-        ("dc.title.alternative.fr", "fr"),
-        ("dc.title.alternative.sl", "sl"),
-    ]
-
-    for alt_field, lang in alt_titles:
-        if alt_field in doc:
-            name_field.append(
-                {"lang": lang, "trans": "H", "text": get_text_field(doc[alt_field])}
-            )
-            alt_titles_added = True
+    # Handle alternative titles (dc.title.alternative); one lookup per field
+    name_count = len(name_field)
+    name_field.extend(
+        {"lang": lang, "trans": "H", "text": get_text_field(value)}
+        for alt_field, lang in ALT_TITLE_FIELDS
+        if (value := get(alt_field)) is not None
+    )
+    alt_titles_added = len(name_field) > name_count
 
     # Add fallback for main title if no language-specific title was added
     if not main_title_added and "dc.title" in doc:
@@ -337,14 +329,7 @@ for doc in solr_docs:
     # Prepare the electronicAddress field
     electronic_address = []
 
-    # Mapping of SOLR fields to their prefixes
-    contact_fields = {
-        "risorgunit.electronicAddress.email": "email:",
-        "risorgunit.electronicAddress.telephone": "tel:",
-        "risorgunit.electronicAddress.fax": "fax:",
-    }
-
-    for field, prefix in contact_fields.items():
+    for field, prefix in CONTACT_FIELDS:
         if field in doc:
             # Ensure the value is a string
             contact_value = get_text_field(doc[field])
@@ -352,32 +337,109 @@ for doc in solr_docs:
                 electronic_address.append(f"{prefix}{contact_value}")
 
     # Construct the JSON object
-    json_obj = {
-        "id": doc.get("search.resourceid"),
+    return {
+        "id": get("search.resourceid"),
         "name": name_field,
-        "type": doc.get("risorgunit.type", ""),
-        "acronym": doc.get("crisou.acronym", ""),
-        "identifiers": [],
+        "type": get("risorgunit.type", ""),
+        "acronym": get("crisou.acronym", ""),
+        "identifiers": EMPTY_ARRAY,
         "address": {
-            "countryCode": doc.get("organization.address.addressCountry", ""),
-            # **parsed_address,  # Merge parsed address parts
-            "addrline1": doc.get("risorgunit.postAddress.addrline1", ""),
-            "postCode": doc.get("risorgunit.postAddress.postCode", ""),
-            "cityTown": doc.get("organization.address.addressLocality", ""),
+            "countryCode": get("organization.address.addressCountry", ""),
+            # **parse_address(get("organization.address.addressLocality", "")),
+            "addrline1": get("risorgunit.postAddress.addrline1", ""),
+            "postCode": get("risorgunit.postAddress.postCode", ""),
+            "cityTown": get("organization.address.addressLocality", ""),
             "stateOfCountry": "Austria",
         },
         "electronicAddress": electronic_address,
-        "website": doc.get("oairecerif.identifier.url", ""),
-        "level": "LEVEL_" + str(level_mapping.get(doc.get("search.resourceid"), "")),
-        "partOf": doc.get("organization.parentOrganization_authority", ""),
+        "website": get("oairecerif.identifier.url", ""),
+        "level": "LEVEL_" + str(level_mapping.get(get("search.resourceid"), "")),
+        "partOf": get("organization.parentOrganization_authority", ""),
         "startDate": start_date,  # Use the validated start_date
     }
-    output.append(json_obj)
+
+
+def iter_solr_docs(solr, query, fields, sort, rows=500):
+    """
+    Yields all documents matching a Solr query, paging with a cursor (cursorMark).
+    Unlike start/rows paging, the cost of a page does not grow with its offset, and
+    no results are cut off.
+
+    Args:
+        solr (pysolr.Solr): The Solr client.
+        query (str): The Solr query.
+        fields (list): The fields to return.
+        sort (str): The sort order; must end with the unique key (search.uniqueid).
+        rows (int): The number of documents fetched per page.
+
+    Yields:
+        dict: The matching documents.
+    """
+    cursor = "*"
+    while True:
+        results = solr.search(
+            query, fl=",".join(fields), sort=sort, rows=rows, cursorMark=cursor
+        )
+        yield from results.docs
+        if not results.nextCursorMark or results.nextCursorMark == cursor:
+            break
+        cursor = results.nextCursorMark
+
+
+def mount_http_adapter(session):
+    """
+    Mounts a pooled HTTP adapter with retries on a requests session, so consecutive
+    requests (e.g., the pages of a Solr query) reuse kept-alive connections.
+
+    Args:
+        session (requests.Session): The session to configure.
+
+    Returns:
+        requests.Session: The configured session.
+    """
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.2),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Initialize the DSpace client
+d = DSpaceClient(
+    api_endpoint=os.getenv("DSPACE_REST_API_URL"),
+    unauthenticated=True,
+    fake_user_agent=True,
+    solr_endpoint=os.getenv("SOLR_ENDPOINT") + "/search",
+    solr_auth=None,
+)
+mount_http_adapter(d.session)
+# pysolr creates its own session lazily; give it a pooled one up front
+d.solr.session = mount_http_adapter(requests.Session())
+
+# Fetch all org units; the unique key makes the sort order total for cursor paging
+solr_query = "entityType:OrgUnit AND organization.identifier.mdwonline:[* TO *]"
+solr_sort = "dc.title_sort asc, search.uniqueid asc"
+solr_docs = list(iter_solr_docs(d.solr, solr_query, SOLR_FIELDS, solr_sort))
+
+# ID of the top-level organization
+top_unit_id = "37ddc68f-9cd7-4b80-b6dc-1d15a65eb34b"
+
+# Calculate the levels for all documents
+level_mapping = calculate_levels(solr_docs, top_unit_id)
+
+# Build the organigram entries
+output = [build_org_unit(doc, level_mapping) for doc in solr_docs]
 
 # Output the results as JSON file with name "organigram_YYYY-MM-DD.json"
 # YYYY-MM-DD is today's date
-logging.debug(json.dumps(output, indent=4, ensure_ascii=False))
+encoded_output = msgspec.json.encode(output)
+if logging.getLogger().isEnabledFor(logging.DEBUG):
+    logging.debug(encoded_output.decode("utf-8"))
 today = datetime.datetime.now().isoformat()
 output_file_name = f"organigramm_{today[:10]}.json"
-with open(output_file_name, "w", encoding="utf-8") as f:
-    json.dump(output, f, indent=4, ensure_ascii=False)
+# msgspec writes UTF-8 without escaping, like json.dump(..., ensure_ascii=False)
+with open(output_file_name, "wb") as f:
+    f.write(msgspec.json.format(encoded_output, indent=4))
@@ -21,7 +21,7 @@ Constants:
 - `OUTPUT_FILE` (Path): Path to save the merged OpenAPI specification.
 
 Dependencies:
-- `json`: For parsing and writing JSON files.
+- `msgspec`: For parsing and writing JSON files.
 - `pathlib.Path`: For handling file paths in a platform-independent manner.
 - `merge_openapi_utils`: A custom module providing helper functions for processing and 
   merging OpenAPI JSON files.
@@ -40,3 +40,70 @@ The script uses default constants for input file paths, output file paths, and O
 metadata. Update the constants or extend the script for custom use cases.
 
 """
+
+
+from pathlib import Path
+import msgspec
+
+from merge_openapi_utils import load_and_merge_file
+
+TITLE = "RIS Synergy API"
+DESCRIPTION = "Full API for RIS Synergy"
+VERSION = "1.0"
+OPEN_API_SERVER_URL = "https://default-url.com"
+# Base directory for app folder
+BASE_DIR = Path(__file__).resolve().parent.parent / "app"
+INPUT_FILE_PATHS = [
+        BASE_DIR
+        / "rissynergy"
+        / "jsonschemas"
+        / f"RIS-SYNERGY-info-api-{VERSION}-swagger.json",
+        BASE_DIR
+        / "rissynergy"
+        / "jsonschemas"
+        / f"RIS-SYNERGY-org-unit_api-{VERSION}-swagger.json",
+        BASE_DIR
+        / "rissynergy"
+        / "jsonschemas"
+        / f"RIS-SYNERGY-project-api-{VERSION}-swagger.json",
+    ]
+OUTPUT_FILE = BASE_DIR / "rissynergy" / "jsonschemas" / f"ris-synergy-{VERSION}.json"
+
+
+def merge_openapi_files(file_paths, output_file, new_title, new_description, version):
+    """
+    Merges multiple OpenAPI JSON files into one cohesive specification.
+
+    Parameters:
+    - file_paths (list of str): List of paths to the OpenAPI JSON files to merge.
+    - output_file (str): Path to save the merged OpenAPI JSON file.
+    - new_title (str): Title for the merged OpenAPI specification.
+    - new_description (str): Description for the merged OpenAPI specification.
+    - version (str): Version for the merged OpenAPI specification.
+    """
+    merged_api = {
+        "openapi": "3.0.1",
+        "info": {
+            "title": new_title,
+            "description": new_description,
+            "version": version,
+        },
+        "servers": [{"url": f"{OPEN_API_SERVER_URL}/ris-synergy"}],
+        "paths": {},
+        "components": {},
+    }
+
+    # The placeholders of the source files only occur in their `servers` sections,
+    # which are not merged, so the files are parsed from bytes without preprocessing
+    for file_path in file_paths:
+        load_and_merge_file(file_path, merged_api)
+
+    # Save merged API to the output JSON file
+    output_file = Path(output_file)
+    with open(output_file, "wb") as f:
+        f.write(msgspec.json.format(msgspec.json.encode(merged_api), indent=2))
+    print(f"Merged API saved to {output_file}")
+
+
+if __name__ == "__main__":
+    merge_openapi_files(INPUT_FILE_PATHS, OUTPUT_FILE, TITLE, DESCRIPTION, VERSION)
@@ -29,6 +29,8 @@ Dependencies:
 Functions:
 - `merge_openapi_files`: 
     Merges multiple OpenAPI YAML files into one unified OpenAPI specification.
+- `is_merged_file_current`:
+    Checks if a previously merged OpenAPI file is still up to date.
 
 Usage:
 Run the script directly to merge predefined OpenAPI YAML files and save the result to a 
@@ -39,13 +41,24 @@ specified output file:
 The script uses default constants for input file paths, output file paths, and OpenAPI 
 metadata. Update the constants or extend the script for custom use cases.
 
+The merge is skipped if the output file is newer than all input files and has the same
+metadata and server URL. Pass `--force` to merge anyway:
+
+    python merge_open_api_yamls.py --force
+
 """
 
 
+import argparse
 from pathlib import Path
 import yaml
 
-from merge_openapi_utils import load_and_merge_file, preprocess_yaml_content
+from merge_openapi_utils import (
+    YAML_DUMPER,
+    YAML_LOADER,
+    load_and_merge_file,
+    replace_placeholders,
+)
 
 TITLE = "RIS Synergy API"
 DESCRIPTION = "Full API for RIS Synergy"
@@ -70,9 +83,36 @@ INPUT_FILE_PATHS = [
 OUTPUT_FILE = BASE_DIR / "rissynergy" / "openapi" / f"ris-synergy-{VERSION}.yaml"
 
 
-def merge_openapi_files(file_paths, output_file, new_title, new_description, version):
+def is_merged_file_current(file_paths, output_file, header):
+    """
+    Checks if a previously merged OpenAPI file is still up to date.
+
+    Parameters:
+    - file_paths (list of str): List of paths to the source OpenAPI YAML files.
+    - output_file (str): Path of the merged OpenAPI YAML file.
+    - header (dict): The expected `openapi`, `info` and `servers` sections.
+
+    Returns:
+    - bool: True if the merged file is newer than all source files and has the
+      expected header (e.g., the same server URL), otherwise False.
+    """
+    try:
+        output_mtime = Path(output_file).stat().st_mtime_ns
+        if any(Path(path).stat().st_mtime_ns > output_mtime for path in file_paths):
+            return False
+        with open(output_file, "rb") as f:
+            existing = yaml.load(f, Loader=YAML_LOADER)  # nosec B506
+        return all(existing.get(key) == value for key, value in header.items())
+    except (OSError, yaml.YAMLError, AttributeError):
+        return False
+
+
+def merge_openapi_files(
+    file_paths, output_file, new_title, new_description, version, force=False
+):
     """
     Merges multiple OpenAPI YAML files into one cohesive specification.
+    The merge is skipped if the output file is already up to date.
 
     Parameters:
     - file_paths (list of str): List of paths to the OpenAPI YAML files to merge.
@@ -80,6 +120,7 @@ def merge_openapi_files(file_paths, output_file, new_title, new_description, ver
     - new_title (str): Title for the merged OpenAPI specification.
     - new_description (str): Description for the merged OpenAPI specification.
     - version (str): Version for the merged OpenAPI specification.
+    - force (bool): Merge even if the output file is up to date.
     """
     merged_api = {
         "openapi": "3.0.1",
@@ -93,21 +134,43 @@ def merge_openapi_files(file_paths, output_file, new_title, new_description, ver
         "components": {},
     }
 
-    for file_path in file_paths:
+    header = {key: merged_api[key] for key in ("openapi", "info", "servers")}
+    if not force and is_merged_file_current(file_paths, output_file, header):
+        print(f"Merged API {output_file} is up to date")
+        return
 
-        def preprocess_fn(content):
-            return preprocess_yaml_content(
-                content, "{{SERVER_URL}}", OPEN_API_SERVER_URL
-            )
+    # The files are processed as bytes, so the placeholders are replaced without
+    # decoding them
+    replacements = {b"{{SERVER_URL}}": OPEN_API_SERVER_URL.encode("utf-8")}
 
+    def preprocess_fn(content):
+        return replace_placeholders(content, replacements)
+
+    for file_path in file_paths:
         load_and_merge_file(file_path, merged_api, preprocess_fn)
 
     # Save merged API to the output YAML file
     output_file = Path(output_file)
     with open(output_file, "w", encoding="utf-8") as f:
-        yaml.dump(merged_api, f, default_flow_style=False)
+        # Keep the insertion order (openapi, info, servers, ...) instead of sorting,
+        # and write non-ASCII text as is instead of escaping it
+        yaml.dump(
+            merged_api,
+            f,
+            Dumper=YAML_DUMPER,
+            default_flow_style=False,
+            sort_keys=False,
+            allow_unicode=True,
+        )
     print(f"Merged API saved to {output_file}")
 
 
 if __name__ == "__main__":
-    merge_openapi_files(INPUT_FILE_PATHS, OUTPUT_FILE, TITLE, DESCRIPTION, VERSION)
+    parser = argparse.ArgumentParser(description="Merge the OpenAPI YAML files.")
+    parser.add_argument(
+        "--force", action="store_true", help="merge even if the output is up to date"
+    )
+    args = parser.parse_args()
+    merge_openapi_files(
+        INPUT_FILE_PATHS, OUTPUT_FILE, TITLE, DESCRIPTION, VERSION, force=args.force
+    )
@@ -7,32 +7,70 @@ YAML format.
 
 Functions:
 - `preprocess_yaml_content`: Replaces placeholders in YAML content with specified values.
+- `replace_placeholders`: Replaces several placeholders in a single pass over the content.
 - `merge_components`: Merges `components` sections from OpenAPI specifications.
 - `merge_paths`: Merges `paths` sections from OpenAPI specifications.
 - `load_and_merge_file`: Loads an OpenAPI specification from JSON or YAML and merges it 
   into the specified object.
 """
 
-import json
+import re
+from functools import lru_cache
 from pathlib import Path
+import msgspec
 import yaml
 
+# libyaml based loader and dumper, if PyYAML was built with libyaml
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 def preprocess_yaml_content(content, placeholder, replacement):
     """
     Replaces placeholders in YAML content with the specified replacement value.
     
     Parameters:
-    - content (str): Raw YAML content.
-    - placeholder (str): Placeholder string to replace.
-    - replacement (str): Replacement value.
+    - content (bytes or str): Raw YAML content.
+    - placeholder (bytes or str): Placeholder to replace (same type as `content`).
+    - replacement (bytes or str): Replacement value (same type as `content`).
 
     Returns:
-    - str: Processed YAML content.
+    - bytes or str: Processed YAML content.
     """
     return content.replace(placeholder, replacement)
 
 
+@lru_cache(maxsize=None)
+def _placeholder_pattern(placeholders):
+    """
+    Compiles (once per set of placeholders) a pattern matching any of them.
+    """
+    return re.compile(b"|".join(re.escape(placeholder) for placeholder in placeholders))
+
+
+def replace_placeholders(content, replacements):
+    """
+    Replaces placeholders in raw content using a table of replacement values.
+
+    A single placeholder is replaced with `bytes.replace`; several placeholders are
+    replaced in one scan of the content with a precompiled pattern, instead of one
+    full pass (and copy) of the content per placeholder.
+
+    Parameters:
+    - content (bytes): Raw YAML or JSON content.
+    - replacements (dict): Mapping of placeholder (bytes) to replacement (bytes).
+
+    Returns:
+    - bytes: Processed content.
+    """
+    if len(replacements) == 1:
+        ((placeholder, replacement),) = replacements.items()
+        return content.replace(placeholder, replacement)
+    # Longest first, so a placeholder is never shadowed by one of its prefixes
+    pattern = _placeholder_pattern(tuple(sorted(replacements, key=len, reverse=True)))
+    return pattern.sub(lambda match: replacements[match.group()], content)
+
+
 def merge_components(merged, new_components):
     """
     Merges OpenAPI components from `new_components` into `merged`.
@@ -42,10 +80,7 @@ def merge_components(merged, new_components):
     - new_components (dict): Components to be added.
     """
     for comp_type, comp_data in new_components.items():
-        if comp_type not in merged:
-            merged[comp_type] = comp_data
-        else:
-            merged[comp_type].update(comp_data)
+        merged.setdefault(comp_type, {}).update(comp_data)
 
 
 def merge_paths(merged, new_paths):
@@ -65,8 +100,10 @@ def load_and_merge_file(file_path, merged_api, preprocess_fn=None):
 
     Parameters:
     - file_path (str or Path): Path to the OpenAPI file.
-    - merged_api (dict): Existing merged OpenAPI specification.
-    - preprocess_fn (callable, optional): Function to preprocess raw content.
+    - merged_api (dict): Existing merged OpenAPI specification, with `paths` and
+      `components` sections.
+    - preprocess_fn (callable, optional): Function to preprocess the raw content
+      (bytes).
 
     Features:
     - Handles both JSON and YAML file formats.
@@ -81,21 +118,18 @@ def load_and_merge_file(file_path, merged_api, preprocess_fn=None):
         print(f"Warning: File not found - {file_path}")
         return
 
-    with open(file_path, "r", encoding="utf-8") as f:
-        raw_content = f.read()
-        if preprocess_fn:
-            raw_content = preprocess_fn(raw_content)
-        api_data = (
-            json.loads(raw_content)
-            if file_path.suffix == ".json"
-            else yaml.safe_load(raw_content)
-        )
-
-        if "paths" in api_data:
-            merge_paths(merged_api["paths"], api_data["paths"])
-
-        if "components" in api_data:
-            if "components" not in merged_api:
-                merged_api["components"] = api_data["components"]
-            else:
-                merge_components(merged_api["components"], api_data["components"])
+    # Both parsers accept UTF-8 bytes, so the content is never decoded to str
+    raw_content = file_path.read_bytes()
+    if preprocess_fn:
+        raw_content = preprocess_fn(raw_content)
+    api_data = (
+        msgspec.json.decode(raw_content)
+        if file_path.suffix == ".json"
+        else yaml.load(raw_content, Loader=YAML_LOADER)  # nosec B506
+    )
+
+    if "paths" in api_data:
+        merge_paths(merged_api["paths"], api_data["paths"])
+
+    if "components" in api_data:
+        merge_components(merged_api["components"], api_data["components"])
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+Script: precompile_specs.py
+
+This script converts the OpenAPI specification YAML files loaded by the application into
+JSON copies stored next to them. The application loads the JSON copies when they are at
+least as new as the YAML files, which is much faster than parsing the YAML files on startup.
+
+Key Features:
+- Converts the org unit, info and project specs of the supported API version
+  (`SUPPORTED_API_VERSION`, default "1.0") into sibling `*.json` files.
+- Keeps placeholders (e.g., {{SERVER_URL}}) intact; they are replaced at runtime.
+- Uses the same conversion as the application (`app/rissynergy/openapi_specs.py`),
+  loaded without importing the Flask application.
+
+Constants:
+- `BASE_DIR` (Path): Base directory for the app folder.
+- `RISSYNERGY_DIR` (Path): Directory of the `ris-synergy` blueprint.
+- `OPENAPI_DIR` (Path): Directory containing the OpenAPI YAML files.
+
+Dependencies:
+- `bootstrap.bootstrap`: Load environment variables from a `.env` file and set up logging.
+- `openapi_specs`: For converting the YAML files into JSON files.
+
+Functions:
+- `precompile_specs`:
+    Converts the OpenAPI YAML files the application loads for an API version.
+
+Usage:
+Run the script at build time (e.g., in the container image build) after the OpenAPI
+files have been copied:
+
+    python scripts/precompile_specs.py
+
+"""
+
+
+import os
+import sys
+from pathlib import Path
+import msgspec
+import yaml
+
+from bootstrap import bootstrap
+
+# Base directory for app folder
+BASE_DIR = Path(__file__).resolve().parent.parent / "app"
+RISSYNERGY_DIR = BASE_DIR / "rissynergy"
+OPENAPI_DIR = RISSYNERGY_DIR / "openapi"
+
+# Importing through the `app` package would create the Flask application
+sys.path.insert(0, str(RISSYNERGY_DIR))
+from openapi_specs import (  # noqa: E402 pylint: disable=wrong-import-position
+    openapi_spec_file_names,
+    write_json_copy,
+)
+
+
+def precompile_specs(openapi_dir, api_version):
+    """
+    Converts the OpenAPI YAML files the application loads into JSON files.
+
+    Parameters:
+    - openapi_dir (str or Path): Directory containing the OpenAPI YAML files.
+    - api_version (str): Supported API version the specs are selected for.
+    """
+    for file_name in openapi_spec_file_names(api_version):
+        yaml_file = Path(openapi_dir) / file_name
+        try:
+            json_file = Path(write_json_copy(str(yaml_file)))
+            print(f"Precompiled {yaml_file.name} to {json_file.name}")
+        except (
+            yaml.YAMLError,
+            msgspec.EncodeError,
+            TypeError,
+            ValueError,
+            OSError,
+        ) as e:
+            print(f"Error: Could not precompile {yaml_file.name}: {e}")
+
+
+if __name__ == "__main__":
+    bootstrap()
+    precompile_specs(OPENAPI_DIR, os.getenv("SUPPORTED_API_VERSION", "1.0"))
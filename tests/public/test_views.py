@@ -18,6 +18,8 @@ def app_with_blueprint(monkeypatch):
 
     app = Flask(__name__, template_folder=template_path, static_folder=static_path)
     app.config["TESTING"] = True
+    # The shipped templates only provide the "mdw" theme
+    app.config["THEME"] = "mdw"
 
     # Mock STATIC_FOLDER environment variable
     monkeypatch.setenv("STATIC_FOLDER", static_path)
@@ -0,0 +1,71 @@
+"""
+Module for testing the rissynergy file watcher.
+"""
+
+import time
+import pytest
+from unittest.mock import patch
+
+from app.rissynergy import file_watcher
+from app.rissynergy.file_watcher import (
+    is_watching,
+    start_file_watcher,
+    watcher_generation,
+)
+
+
+@pytest.fixture
+def watcher_state():
+    """Fixture to stop a started watcher and restore the initial watcher state."""
+    state = dict(file_watcher._WATCHER_STATE)
+    yield file_watcher._WATCHER_STATE
+    observer = file_watcher._WATCHER_STATE["observer"]
+    if observer is not None and observer is not state["observer"]:
+        observer.stop()
+        observer.join()
+    file_watcher._WATCHER_STATE.update(state)
+
+
+def wait_for(condition, timeout=5.0):
+    """Poll a condition until it is true or the timeout expires."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def test_start_file_watcher_disabled(tmp_path, watcher_state):
+    """Test that the watcher doesn't start when it is disabled."""
+    with patch("app.rissynergy.file_watcher.Observer", None):
+        assert start_file_watcher([str(tmp_path)], lambda path: None) is False
+    assert is_watching(str(tmp_path)) is False
+
+
+def test_start_file_watcher_reports_changes(tmp_path, watcher_state):
+    """Test that changed files are passed to the callback."""
+    observers = pytest.importorskip("watchdog.observers")
+    changed = []
+    generation = watcher_generation()
+
+    with patch("app.rissynergy.file_watcher.Observer", observers.Observer):
+        assert start_file_watcher([str(tmp_path)], changed.append) is True
+
+    assert is_watching(str(tmp_path)) is True
+    assert is_watching(str(tmp_path / "other")) is False
+
+    changed_file = tmp_path / "schema.json"
+    changed_file.write_text("{}", encoding="utf-8")
+
+    assert wait_for(lambda: str(changed_file) in changed)
+    assert watcher_generation() > generation
+
+
+def test_reset_after_fork(tmp_path, watcher_state):
+    """Test that a forked child forgets the watcher of its parent."""
+    watcher_state.update(directories=frozenset([str(tmp_path)]))
+    file_watcher._reset_after_fork()
+
+    assert watcher_state["observer"] is None
+    assert is_watching(str(tmp_path)) is False
@@ -0,0 +1,49 @@
+"""
+Module for testing the rissynergy OpenAPI spec conversion.
+"""
+
+import json
+import os
+import pytest
+import yaml
+
+from app.rissynergy.openapi_specs import openapi_spec_file_names, write_json_copy
+
+
+def test_openapi_spec_file_names():
+    """Test that the file names of the loaded specs are built for the API version."""
+    assert openapi_spec_file_names("1.1") == (
+        "RIS-SYNERGY-org-unit_api-1.1-resolved.yaml",
+        "RIS-SYNERGY-info-api-1.1-resolved.yaml",
+        "RIS-SYNERGY-project-api-1.1-resolved.yaml",
+    )
+
+
+def test_openapi_spec_files_exist():
+    """Test that the specs loaded for the default API version are shipped."""
+    openapi_dir = os.path.join("app", "rissynergy", "openapi")
+    for file_name in openapi_spec_file_names("1.0"):
+        assert os.path.isfile(os.path.join(openapi_dir, file_name))
+
+
+def test_write_json_copy(tmp_path):
+    """Test that write_json_copy writes a JSON copy keeping the placeholder."""
+    yaml_file = tmp_path / "spec.yaml"
+    yaml_file.write_text("servers:\n  - url: {{SERVER_URL}}/api\n", encoding="utf-8")
+
+    json_path = write_json_copy(str(yaml_file))
+
+    assert json_path == str(tmp_path / "spec.json")
+    with open(json_path, "r", encoding="utf-8") as f:
+        assert json.load(f) == {"servers": [{"url": "{{SERVER_URL}}/api"}]}
+    assert [p.name for p in tmp_path.iterdir() if p.suffix == ".tmp"] == []
+
+
+def test_write_json_copy_invalid_yaml(tmp_path):
+    """Test that write_json_copy raises on invalid YAML and writes no copy."""
+    yaml_file = tmp_path / "spec.yaml"
+    yaml_file.write_text("key: [unclosed\n", encoding="utf-8")
+
+    with pytest.raises(yaml.YAMLError):
+        write_json_copy(str(yaml_file))
+    assert not (tmp_path / "spec.json").exists()
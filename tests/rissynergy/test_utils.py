@@ -6,7 +6,11 @@ This module contains unit tests for the rissynergy utility functions.
 from unittest.mock import patch
 
 import requests
-from app.rissynergy.utils import download_json_data, validate_json_against_json_schema
+from app.rissynergy.utils import (
+    download_json_data,
+    get_json_schema_validator,
+    validate_json_against_json_schema,
+)
 
 
 def test_download_json_data_success():
@@ -16,7 +20,7 @@ def test_download_json_data_success():
     mock_url = "https://api.example.com/data"
     mock_response = {"key": "value"}
 
-    with patch("app.rissynergy.utils.requests.get") as mock_get:
+    with patch("app.rissynergy.utils._HTTP_SESSION.get") as mock_get:
         mock_get.return_value.status_code = 200
         mock_get.return_value.json.return_value = mock_response
 
@@ -34,7 +38,7 @@ def test_download_json_data_failure():
     """
     mock_url = "https://api.example.com/data"
 
-    with patch("app.rissynergy.utils.requests.get") as mock_get:
+    with patch("app.rissynergy.utils._HTTP_SESSION.get") as mock_get:
         mock_get.return_value.status_code = 404
         mock_get.return_value.text = "Not Found"
 
@@ -52,7 +56,7 @@ def test_download_json_data_request_exception():
     """
     mock_url = "https://api.example.com/data"
 
-    with patch("app.rissynergy.utils.requests.get") as mock_get:
+    with patch("app.rissynergy.utils._HTTP_SESSION.get") as mock_get:
         mock_get.side_effect = requests.RequestException("Connection error")
 
         result = download_json_data(mock_url)
@@ -163,3 +167,16 @@ def test_validate_json_against_json_schema_type_error():
     assert (
         "argument of type 'int' is not iterable" in error_message
     )  # Check the actual error message
+
+
+def test_get_json_schema_validator_cached():
+    """
+    Test that the validator of a schema is built only once.
+    """
+    json_schema = {"type": "object", "required": ["name"]}
+
+    validator = get_json_schema_validator(json_schema)
+
+    assert get_json_schema_validator(json_schema) is validator
+    assert get_json_schema_validator(dict(json_schema)) is not validator
+    assert validate_json_against_json_schema({"name": "John"}, json_schema) is True
@@ -7,14 +7,23 @@ import json
 import yaml
 import pytest
 import logging
-from unittest.mock import mock_open, patch
+from unittest.mock import MagicMock, mock_open, patch
 from flask import Flask, jsonify, request, url_for
 
+from app.error_handlers import register_error_handlers
+
+from app.rissynergy import views
 from app.rissynergy.views import (
     blueprint,
     is_valid_yaml,
     get_latest_json_file,
+    get_cached_latest_json_file,
     replace_placeholder_in_file,
+    load_cached_document,
+    preload_documents,
+    prewarm_caches,
+    invalidate_cached_file,
+    yaml_to_json_cache,
     INFO_OPENAPI_SPEC_PATH,
     PROJECT_OPENAPI_SPEC_PATH,
     ORGUNIT_OPENAPI_SPEC_PATH,
@@ -58,29 +67,47 @@ def test_is_valid_yaml_file_not_found():
 
 
 # Test cases for `get_latest_json_file`
+def mock_scandir(names, is_file=True):
+    """Create a mock for os.scandir returning entries with the given names."""
+    entries = []
+    for name in names:
+        entry = MagicMock()
+        entry.name = name
+        entry.is_file.return_value = is_file
+        entries.append(entry)
+    scandir = MagicMock()
+    scandir.return_value.__enter__.return_value = entries
+    return scandir
+
+
 def test_get_latest_json_file_valid():
     """Test get_latest_json_file with valid files in the directory."""
-    mock_files = ["organigram_202311.json", "organigram_202310.json"]
-    with patch("os.listdir", return_value=mock_files):
-        with patch("os.path.isdir", return_value=True):
-            assert get_latest_json_file() == "organigram_202311.json"
+    mock_files = ["organigram_202310.json", "organigram_202311.json", "other.json"]
+    with patch("os.scandir", mock_scandir(mock_files)):
+        assert get_latest_json_file() == "organigram_202311.json"
+
+
+def test_get_latest_json_file_ignores_directories():
+    """Test that get_latest_json_file only returns regular files."""
+    with patch("os.scandir", mock_scandir(["organigram_202311.json"], is_file=False)):
+        assert get_latest_json_file() is None
 
 
 def test_get_latest_json_file_no_files():
     """Test get_latest_json_file when no matching files are found."""
-    with patch("os.listdir", return_value=[]):
+    with patch("os.scandir", mock_scandir([])):
         assert get_latest_json_file() is None
 
 
 def test_get_latest_json_file_directory_not_found():
     """Test get_latest_json_file when JSON_DIR does not exist."""
-    with patch("os.listdir", side_effect=FileNotFoundError):
+    with patch("os.scandir", side_effect=FileNotFoundError):
         assert get_latest_json_file() is None
 
 
 def test_get_latest_json_file_permission_error():
     """Test get_latest_json_file when JSON_DIR has permission issues."""
-    with patch("os.listdir", side_effect=PermissionError):
+    with patch("os.scandir", side_effect=PermissionError):
         assert get_latest_json_file() is None
 
 
@@ -348,3 +375,462 @@ def test_get_info_success(app_with_blueprint):
 
                 assert response.status_code == 200
                 assert response.get_json() == mock_data
+
+
+def test_get_ris_synergy_schema_sets_cache_headers(app_with_blueprint, tmp_path):
+    """Test that schema responses carry ETag, Last-Modified and Cache-Control."""
+    schema_file = tmp_path / "schema.json"
+    schema_file.write_text('{"type": "object"}', encoding="utf-8")
+
+    with patch("app.rissynergy.views.RIS_SYNERGY_SCHEMA_PATH", str(schema_file)):
+        with app_with_blueprint.test_client() as client:
+            response = client.get(
+                "/ris-synergy/ris_synergy.json",
+                headers={"Accept": "application/json"},
+            )
+
+            assert response.status_code == 200
+            assert response.get_json() == {"type": "object"}
+            assert response.headers["ETag"]
+            assert "Last-Modified" in response.headers
+            assert "public" in response.headers["Cache-Control"]
+            assert "max-age=3600" in response.headers["Cache-Control"]
+
+
+def test_get_ris_synergy_schema_not_modified(app_with_blueprint, tmp_path):
+    """Test that a matching If-None-Match header yields a bodyless 304."""
+    schema_file = tmp_path / "schema.json"
+    schema_file.write_text('{"type": "object"}', encoding="utf-8")
+
+    with patch("app.rissynergy.views.RIS_SYNERGY_SCHEMA_PATH", str(schema_file)):
+        with app_with_blueprint.test_client() as client:
+            first = client.get(
+                "/ris-synergy/ris_synergy.json",
+                headers={"Accept": "application/json"},
+            )
+            response = client.get(
+                "/ris-synergy/ris_synergy.json",
+                headers={
+                    "Accept": "application/json",
+                    "If-None-Match": first.headers["ETag"],
+                },
+            )
+
+            assert response.status_code == 304
+            assert response.data == b""
+
+
+def test_load_cached_document_reuses_entry(tmp_path):
+    """Test that an unchanged file is parsed only once."""
+    schema_file = tmp_path / "schema.json"
+    schema_file.write_text('{"key": "{{SERVER_URL}}"}', encoding="utf-8")
+
+    with patch(
+        "app.rissynergy.views.replace_placeholder_in_file",
+        wraps=replace_placeholder_in_file,
+    ) as mock_replace:
+        first = load_cached_document(str(schema_file))
+        second = load_cached_document(str(schema_file))
+
+    assert first is second
+    mock_replace.assert_called_once_with(str(schema_file))
+
+
+def test_preload_documents(tmp_path):
+    """Test that preload_documents loads every file into the document cache."""
+    first_file = tmp_path / "first.json"
+    first_file.write_text('{"first": true}', encoding="utf-8")
+    second_file = tmp_path / "second.json"
+    second_file.write_text('{"second": true}', encoding="utf-8")
+
+    paths = (str(first_file), str(second_file))
+    results = preload_documents(paths)
+
+    assert results[str(first_file)]["data"] == {"first": True}
+    assert results[str(second_file)]["data"] == {"second": True}
+    assert load_cached_document(str(first_file)) is results[str(first_file)]
+
+
+def test_yaml_to_json_cache_creates_copy(tmp_path):
+    """Test that yaml_to_json_cache writes a JSON copy keeping the placeholder."""
+    yaml_file = tmp_path / "spec.yaml"
+    yaml_file.write_text("servers:\n  - url: {{SERVER_URL}}/api\n", encoding="utf-8")
+
+    json_path = yaml_to_json_cache(str(yaml_file))
+
+    assert json_path == str(tmp_path / "spec.json")
+    with open(json_path, "r", encoding="utf-8") as f:
+        assert json.load(f) == {"servers": [{"url": "{{SERVER_URL}}/api"}]}
+
+
+def test_yaml_to_json_cache_regenerates_stale_copy(tmp_path):
+    """Test that an outdated JSON copy is regenerated."""
+    yaml_file = tmp_path / "spec.yaml"
+    yaml_file.write_text("key: new\n", encoding="utf-8")
+    json_file = tmp_path / "spec.json"
+    json_file.write_text('{"key": "old"}', encoding="utf-8")
+    os.utime(json_file, (0, 0))
+
+    yaml_to_json_cache(str(yaml_file))
+
+    assert json.loads(json_file.read_text(encoding="utf-8")) == {"key": "new"}
+
+
+def test_yaml_to_json_cache_falls_back_to_yaml(tmp_path):
+    """Test that the YAML path is returned if the copy cannot be created."""
+    missing_file = str(tmp_path / "missing.yaml")
+    assert yaml_to_json_cache(missing_file) == missing_file
+
+
+def test_get_organigram_by_date_serves_file(app_with_blueprint, tmp_path, monkeypatch):
+    """Test that the organigram for a given date is served from disk."""
+    monkeypatch.setenv("ENABLED_ENDPOINTS", "orgunit")
+    (tmp_path / "organigram_2024-01-31.json").write_text(
+        '{"id": "root"}', encoding="utf-8"
+    )
+
+    with patch("app.rissynergy.views._RESOLVED_JSON_DIR", str(tmp_path)):
+        client = app_with_blueprint.test_client()
+        response = client.get(
+            "/ris-synergy/v1/orgUnits/organigram/2024-01-31",
+            headers={"Accept": "application/json"},
+        )
+
+    assert response.status_code == 200
+    assert response.mimetype == "application/json"
+    assert response.get_json() == {"id": "root"}
+    assert response.cache_control.max_age == 3600
+    assert response.headers["ETag"]
+
+
+@pytest.mark.parametrize(
+    "date, status_code",
+    [
+        ("2024-02-01", 500),
+        ("2024-1-31", 500),
+        ("2024-01-3x", 500),
+        ("2024/01/31", 404),
+        ("..%2F..%2Fsecret", 404),
+    ],
+)
+def test_get_organigram_by_date_rejects_unknown_date(
+    app_with_blueprint, tmp_path, monkeypatch, date, status_code
+):
+    """Test that malformed or unknown dates are rejected."""
+    monkeypatch.setenv("ENABLED_ENDPOINTS", "orgunit")
+
+    with patch("app.rissynergy.views._RESOLVED_JSON_DIR", str(tmp_path)):
+        client = app_with_blueprint.test_client()
+        response = client.get(
+            f"/ris-synergy/v1/orgUnits/organigram/{date}",
+            headers={"Accept": "application/json"},
+        )
+
+    assert response.status_code == status_code
+
+
+@pytest.mark.parametrize(
+    "url, path_name, expected",
+    [
+        # Aborts with 500 and is answered by the application's error handler
+        (
+            "/ris-synergy/v1/info",
+            "INFO_DATA_PATH",
+            {"error": "500 Error: Internal server error"},
+        ),
+        (
+            "/ris-synergy/v1/orgUnits/schema",
+            "ORGUNIT_SCHEMA_PATH",
+            {"error": "500 Error: Internal server error"},
+        ),
+        (
+            "/ris-synergy/v1/projects/schema",
+            "PROJECT_SCHEMA_PATH",
+            {"error": "500 Error: Internal server error"},
+        ),
+        # Returns its own JSON 500 body
+        (
+            "/ris-synergy/ris_synergy.json",
+            "RIS_SYNERGY_SCHEMA_PATH",
+            {"error": "Internal server error"},
+        ),
+        (
+            "/ris-synergy/v1/info/schema",
+            "INFO_SCHEMA_PATH",
+            {"error": "Internal server error"},
+        ),
+    ],
+)
+def test_cached_document_endpoints_error(monkeypatch, url, path_name, expected):
+    """Test the exact 500 body of the cached document endpoints on a load failure."""
+    app = Flask(__name__)
+    app.config["TESTING"] = True
+    register_error_handlers(app)
+    app.register_blueprint(blueprint)
+    monkeypatch.setenv("ENABLED_ENDPOINTS", "orgunit,project")
+    with patch(f"app.rissynergy.views.{path_name}", "non_existent_path"):
+        with patch("builtins.open", side_effect=FileNotFoundError()):
+            with app.test_client() as client:
+                response = client.get(url, headers={"Accept": "application/json"})
+
+                assert response.status_code == 500
+                assert response.get_json() == expected
+
+
+def test_show_info_schema_apidocs_caches_redirect(app_with_blueprint):
+    """Test that the apidocs redirect target is resolved only once per app."""
+    with app_with_blueprint.test_client() as client:
+        with patch(
+            "app.rissynergy.views.url_for",
+            return_value="/ris-synergy/v1/info/schema",
+        ) as mock_url_for:
+            first = client.get("/ris-synergy/apidocs/info")
+            second = client.get("/ris-synergy/apidocs/info")
+
+    assert first.headers["Location"] == second.headers["Location"]
+    mock_url_for.assert_called_once_with("ris-synergy.get_info_schema")
+
+
+def test_get_organigram_served_from_cache(app_with_blueprint, tmp_path, monkeypatch):
+    """Test that the latest organigram is parsed once and then served from the cache."""
+    monkeypatch.setenv("ENABLED_ENDPOINTS", "orgunit")
+    spec_file = tmp_path / "spec.json"
+    spec_file.write_text('{"openapi": "3.0.0"}', encoding="utf-8")
+    (tmp_path / "organigram_2024-01-31.json").write_text(
+        '[{"id": "root"}]', encoding="utf-8"
+    )
+
+    with patch("app.rissynergy.views.JSON_DIR", str(tmp_path)), patch(
+        "app.rissynergy.views.ORGUNIT_OPENAPI_SPEC_PATH", str(spec_file)
+    ), patch(
+        "app.rissynergy.views.replace_placeholder_in_file",
+        wraps=replace_placeholder_in_file,
+    ) as mock_replace:
+        client = app_with_blueprint.test_client()
+        first = client.get(
+            "/ris-synergy/v1/orgUnits/organigram",
+            headers={"Accept": "application/json"},
+        )
+        second = client.get(
+            "/ris-synergy/v1/orgUnits/organigram",
+            headers={"Accept": "application/json"},
+        )
+
+    assert first.status_code == second.status_code == 200
+    assert second.get_json() == [{"id": "root"}]
+    assert mock_replace.call_count == 2
+
+
+def test_load_cached_document_compact_body(tmp_path):
+    """Test that the cached body is compact UTF-8 encoded JSON."""
+    schema_file = tmp_path / "schema.json"
+    schema_file.write_text('{"name": "Universität", "list": [1, 2]}', encoding="utf-8")
+
+    entry = load_cached_document(str(schema_file))
+
+    assert entry["body"] == '{"name":"Universität","list":[1,2]}'.encode("utf-8")
+
+
+def test_get_cached_latest_json_file_rescans_on_change(tmp_path):
+    """Test that the directory is only rescanned when its mtime changes."""
+    (tmp_path / "organigram_2024-01-01.json").write_text("[]", encoding="utf-8")
+    os.utime(tmp_path, ns=(1, 1))
+
+    with patch("app.rissynergy.views.JSON_DIR", str(tmp_path)):
+        with patch(
+            "app.rissynergy.views.get_latest_json_file",
+            wraps=get_latest_json_file,
+        ) as mock_latest:
+            assert get_cached_latest_json_file() == "organigram_2024-01-01.json"
+            assert get_cached_latest_json_file() == "organigram_2024-01-01.json"
+            assert mock_latest.call_count == 1
+
+            (tmp_path / "organigram_2024-02-01.json").write_text("[]", encoding="utf-8")
+            os.utime(tmp_path, ns=(2, 2))
+
+            assert get_cached_latest_json_file() == "organigram_2024-02-01.json"
+            assert mock_latest.call_count == 2
+
+
+def test_get_cached_latest_json_file_evicts_previous_organigram(tmp_path):
+    """Test that the cached previous organigram is dropped when a newer file appears."""
+    old_file = tmp_path / "organigram_2024-01-01.json"
+    old_file.write_text('[{"id": "1"}]', encoding="utf-8")
+    os.utime(tmp_path, ns=(1, 1))
+
+    with patch("app.rissynergy.views.JSON_DIR", str(tmp_path)):
+        assert get_cached_latest_json_file() == old_file.name
+        assert load_cached_document(str(old_file)) is not None
+        assert str(old_file) in views._SCHEMA_CACHE
+
+        (tmp_path / "organigram_2024-02-01.json").write_text("[]", encoding="utf-8")
+        os.utime(tmp_path, ns=(2, 2))
+
+        assert get_cached_latest_json_file() == "organigram_2024-02-01.json"
+        assert str(old_file) not in views._SCHEMA_CACHE
+
+
+def test_get_orgunit_uses_index(app_with_blueprint, tmp_path, monkeypatch):
+    """Test that org units are looked up by ID and unknown IDs return 404."""
+    monkeypatch.setenv("ENABLED_ENDPOINTS", "orgunit")
+    (tmp_path / "organigram_2024-01-31.json").write_text(
+        '[{"id": "1", "acronym": "UNI"}, {"id": "2", "acronym": "FAC"}]',
+        encoding="utf-8",
+    )
+
+    with patch("app.rissynergy.views.JSON_DIR", str(tmp_path)):
+        client = app_with_blueprint.test_client()
+        found = client.get(
+            "/ris-synergy/v1/orgUnits/2", headers={"Accept": "application/json"}
+        )
+        missing = client.get(
+            "/ris-synergy/v1/orgUnits/3", headers={"Accept": "application/json"}
+        )
+
+    assert found.status_code == 200
+    assert found.get_json() == {"id": "2", "acronym": "FAC"}
+    assert missing.status_code == 404
+
+
+def test_get_orgunit_duplicate_id_returns_first(
+    app_with_blueprint, tmp_path, monkeypatch
+):
+    """Test that the first org unit wins if an ID is duplicated."""
+    monkeypatch.setenv("ENABLED_ENDPOINTS", "orgunit")
+    (tmp_path / "organigram_2024-01-31.json").write_text(
+        '[{"id": "1", "acronym": "UNI"}, {"id": "1", "acronym": "DUP"}]',
+        encoding="utf-8",
+    )
+
+    with patch("app.rissynergy.views.JSON_DIR", str(tmp_path)):
+        client = app_with_blueprint.test_client()
+        response = client.get(
+            "/ris-synergy/v1/orgUnits/1", headers={"Accept": "application/json"}
+        )
+
+    assert response.status_code == 200
+    assert response.get_json() == {"id": "1", "acronym": "UNI"}
+
+
+def test_get_orgunit_item_without_id(app_with_blueprint, tmp_path, monkeypatch):
+    """Test that an org unit without an ID results in a 500 error."""
+    monkeypatch.setenv("ENABLED_ENDPOINTS", "orgunit")
+    (tmp_path / "organigram_2024-01-31.json").write_text(
+        '[{"id": "1"}, {"acronym": "FAC"}]', encoding="utf-8"
+    )
+
+    with patch("app.rissynergy.views.JSON_DIR", str(tmp_path)):
+        client = app_with_blueprint.test_client()
+        response = client.get(
+            "/ris-synergy/v1/orgUnits/1", headers={"Accept": "application/json"}
+        )
+
+    assert response.status_code == 500
+
+
+def test_is_valid_yaml_memoized(tmp_path):
+    """Test that an unchanged file is parsed only once."""
+    yaml_file = tmp_path / "valid.yaml"
+    yaml_file.write_text("key: value\n", encoding="utf-8")
+
+    with patch("app.rissynergy.views.yaml.parse", wraps=yaml.parse) as mock_parse:
+        assert is_valid_yaml(str(yaml_file)) is True
+        assert is_valid_yaml(str(yaml_file)) is True
+        assert mock_parse.call_count == 1
+
+        yaml_file.write_text("key: [unclosed\n", encoding="utf-8")
+        os.utime(yaml_file, ns=(1, 1))
+        assert is_valid_yaml(str(yaml_file)) is False
+
+
+@pytest.mark.parametrize(
+    "url, path_name",
+    [
+        ("/ris-synergy/v1/info", "INFO_DATA_PATH"),
+        ("/ris-synergy/v1/info/schema", "INFO_SCHEMA_PATH"),
+        ("/ris-synergy/v1/orgUnits/schema", "ORGUNIT_SCHEMA_PATH"),
+        ("/ris-synergy/v1/projects/schema", "PROJECT_SCHEMA_PATH"),
+    ],
+)
+def test_cached_document_endpoints_conditional(
+    app_with_blueprint, tmp_path, monkeypatch, url, path_name
+):
+    """Test that the cached document endpoints support conditional requests."""
+    monkeypatch.setenv("ENABLED_ENDPOINTS", "orgunit,project")
+    document = tmp_path / "document.json"
+    document.write_text('{"type": "object"}', encoding="utf-8")
+
+    with patch(f"app.rissynergy.views.{path_name}", str(document)):
+        with app_with_blueprint.test_client() as client:
+            first = client.get(url, headers={"Accept": "application/json"})
+            second = client.get(
+                url,
+                headers={
+                    "Accept": "application/json",
+                    "If-Modified-Since": first.headers["Last-Modified"],
+                },
+            )
+
+    assert first.status_code == 200
+    assert "max-age=3600" in first.headers["Cache-Control"]
+    assert second.status_code == 304
+
+
+def test_get_organigram_not_modified(app_with_blueprint, tmp_path, monkeypatch):
+    """Test that the organigram answers a matching If-None-Match with a 304."""
+    monkeypatch.setenv("ENABLED_ENDPOINTS", "orgunit")
+    spec_file = tmp_path / "spec.json"
+    spec_file.write_text('{"openapi": "3.0.0"}', encoding="utf-8")
+    (tmp_path / "organigram_2024-01-31.json").write_text("[]", encoding="utf-8")
+
+    with patch("app.rissynergy.views.JSON_DIR", str(tmp_path)), patch(
+        "app.rissynergy.views.ORGUNIT_OPENAPI_SPEC_PATH", str(spec_file)
+    ):
+        client = app_with_blueprint.test_client()
+        first = client.get(
+            "/ris-synergy/v1/orgUnits/organigram",
+            headers={"Accept": "application/json"},
+        )
+        second = client.get(
+            "/ris-synergy/v1/orgUnits/organigram",
+            headers={
+                "Accept": "application/json",
+                "If-None-Match": first.headers["ETag"],
+            },
+        )
+
+    assert first.status_code == 200
+    assert second.status_code == 304
+
+
+def test_prewarm_caches(tmp_path):
+    """Test that prewarm_caches loads the latest organigram and builds its index."""
+    organigram_file = tmp_path / "organigram_2024-01-31.json"
+    organigram_file.write_text('[{"id": "1"}]', encoding="utf-8")
+    spec_file = tmp_path / "spec.json"
+    spec_file.write_text("{}", encoding="utf-8")
+
+    with patch("app.rissynergy.views.JSON_DIR", str(tmp_path)), patch(
+        "app.rissynergy.views.ORGUNIT_OPENAPI_SPEC_PATH", str(spec_file)
+    ), patch("app.rissynergy.views.PRELOADED_DOCUMENT_PATHS", ()):
+        prewarm_caches()
+
+    entry = load_cached_document(str(organigram_file))
+    assert entry["by_id"] == {"1": b'{"id":"1"}'}
+    assert load_cached_document(str(spec_file))["data"] == {}
+
+
+def test_load_cached_document_watched_skips_stat(tmp_path):
+    """Test that a watched file is served from the cache until it is invalidated."""
+    schema_file = tmp_path / "schema.json"
+    schema_file.write_text('{"version": 1}', encoding="utf-8")
+    first = load_cached_document(str(schema_file))
+
+    with patch("app.rissynergy.views.is_watching", return_value=True):
+        with patch("app.rissynergy.views.os.stat", side_effect=AssertionError):
+            assert load_cached_document(str(schema_file)) is first
+
+        schema_file.write_text('{"version": 2}', encoding="utf-8")
+        invalidate_cached_file(str(schema_file))
+
+        assert load_cached_document(str(schema_file))["data"] == {"version": 2}
@@ -7,33 +7,59 @@ from unittest.mock import patch, MagicMock
 import requests
 import pytest
 from flask import Flask
-from app.auth import verify_token
+from werkzeug.exceptions import HTTPException
+from app.auth import clear_token_cache, verify_token
 
 
-@pytest.fixture
-def app_context():
+@pytest.fixture(scope="module")
+def keycloak_app():
     """
-    Provide a Flask app context with Keycloak configurations for testing.
+    Provide a Flask app with Keycloak configurations, created once per module.
     """
     app = Flask(__name__)
     app.config["KEYCLOAK_INTROSPECT_URI"] = "https://keycloak.example.com/introspect"
     app.config["OIDC_CLIENT_ID"] = "test_client_id"
     app.config["OIDC_CREDENTIALS_SECRET"] = "test_client_secret"
+    return app
+
+
+@pytest.fixture
+def app_context(keycloak_app):
+    """
+    Provide a Flask app context with Keycloak configurations for testing.
+    """
+    with keycloak_app.app_context():
+        yield keycloak_app
+
+
+@pytest.fixture(autouse=True)
+def empty_token_cache():
+    """
+    Start every test with an empty token cache.
+    """
+    clear_token_cache()
+    yield
+    clear_token_cache()
 
-    with app.app_context():
-        yield app
+
+@pytest.fixture
+def mock_post():
+    """
+    Patch the introspection request with a successful, pre-built response.
+    Tests only set the response fields they care about.
+    """
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    with patch("app.auth.requests.post", return_value=mock_response) as post:
+        yield post
 
 
-@patch("app.auth.requests.post")
 def test_verify_token_success(mock_post, app_context):
     """
     Test that verify_token successfully validates a token.
     """
     # Mock Keycloak's response
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {"active": True, "username": "test_user"}
-    mock_post.return_value = mock_response
+    mock_post.return_value.json.return_value = {"active": True, "username": "test_user"}
 
     # Call verify_token
     token = "test_token"
@@ -54,44 +80,87 @@ def test_verify_token_success(mock_post, app_context):
     assert token_data["username"] == "test_user"
 
 
-@patch("app.auth.requests.post")
+def test_verify_token_cached(mock_post, app_context):
+    """
+    Test that a second call with the same active token does not ask Keycloak again.
+    """
+    mock_post.return_value.json.return_value = {"active": True, "username": "test_user"}
+
+    first = verify_token("cached_token")
+    second = verify_token("cached_token")
+
+    mock_post.assert_called_once()
+    assert second is first
+
+
+def test_verify_token_cache_disabled(mock_post, app_context, monkeypatch):
+    """
+    Test that a cache TTL of 0 in the app config introspects every call.
+    """
+    monkeypatch.setitem(app_context.config, "KEYCLOAK_TOKEN_CACHE_TTL", 0)
+    mock_post.return_value.json.return_value = {"active": True}
+
+    verify_token("uncached_token")
+    verify_token("uncached_token")
+
+    assert mock_post.call_count == 2
+
+
+def test_verify_token_not_cached_after_exp(mock_post, app_context):
+    """
+    Test that a token is introspected again once its exp claim has passed.
+    """
+    mock_post.return_value.json.return_value = {"active": True, "exp": 0}
+
+    verify_token("expired_token")
+    verify_token("expired_token")
+
+    assert mock_post.call_count == 2
+
+
+def test_verify_token_inactive_not_cached(mock_post, app_context):
+    """
+    Test that inactive tokens are introspected on every call.
+    """
+    mock_post.return_value.json.return_value = {"active": False}
+
+    for _ in range(2):
+        with pytest.raises(HTTPException):
+            verify_token("inactive_token")
+
+    assert mock_post.call_count == 2
+
+
 def test_verify_token_invalid(mock_post, app_context):
     """
     Test that verify_token raises a 401 error for an invalid or expired token.
     """
     # Mock Keycloak's response
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {"active": False}
-    mock_post.return_value = mock_response
+    mock_post.return_value.json.return_value = {"active": False}
 
     # Call verify_token and expect an HTTP 401 error
-    with pytest.raises(Exception) as exc_info:
+    with pytest.raises(HTTPException) as exc_info:
         verify_token("invalid_token")
 
     assert exc_info.value.code == 401
     assert "Invalid or expired token" in exc_info.value.description
 
 
-@patch("app.auth.requests.post")
 def test_verify_token_server_error(mock_post, app_context):
     """
     Test that verify_token raises a 500 error if the Keycloak server is unreachable.
     """
     # Mock Keycloak's response
-    mock_response = MagicMock()
-    mock_response.status_code = 500
-    mock_post.return_value = mock_response
+    mock_post.return_value.status_code = 500
 
     # Call verify_token and expect an HTTP 500 error
-    with pytest.raises(Exception) as exc_info:
+    with pytest.raises(HTTPException) as exc_info:
         verify_token("test_token")
 
     assert exc_info.value.code == 500
     assert "Error connecting to authentication server" in exc_info.value.description
 
 
-@patch("app.auth.requests.post")
 def test_verify_token_request_exception(mock_post, app_context):
     """
     Test that verify_token raises a 500 error if the request fails.
@@ -100,7 +169,7 @@ def test_verify_token_request_exception(mock_post, app_context):
     mock_post.side_effect = requests.RequestException
 
     # Call verify_token and expect an HTTP 500 error
-    with pytest.raises(Exception) as exc_info:
+    with pytest.raises(HTTPException) as exc_info:
         verify_token("test_token")
 
     assert exc_info.value.code == 500
@@ -7,6 +7,7 @@ import os
 import pytest
 from unittest.mock import patch
 from flask import Flask, request, jsonify
+from werkzeug.exceptions import NotAcceptable
 from app.decorators import (
     set_theme,
     set_matomo_enabled,
@@ -18,11 +19,10 @@ from app.decorators import (
 from app.exceptions import TokenError
 
 
-@pytest.fixture
-def app_with_context():
-    """Fixture to create a Flask app with a request context."""
+@pytest.fixture(scope="module")
+def decorated_app():
+    """Fixture to create a Flask app with decorated routes (once per module)."""
     app = Flask(__name__)
-    app.config["KEYCLOAK_ENABLED"] = True
 
     @app.route("/theme")
     @set_theme
@@ -43,22 +43,23 @@ def app_with_context():
     def cache_route():
         return "cached content"
 
-    @app.route("/protected")
-    @keycloak_protected
-    def protected_route():
-        return "protected content"
-
     @app.route("/content")
     @conditional_produces("application/json")
     def content_route():
         return jsonify(content="some content")
 
-    with app.test_request_context():
-        yield app
+    return app
 
 
 @pytest.fixture
-def app_with_keycloak(monkeypatch):
+def app_with_context(decorated_app):
+    """Fixture to provide the decorated Flask app with a request context."""
+    with decorated_app.test_request_context():
+        yield decorated_app
+
+
+@pytest.fixture(scope="module")
+def app_with_keycloak():
     """Fixture to create a Flask app with Keycloak protection enabled."""
     app = Flask(__name__)
     app.config["TESTING"] = True
@@ -79,7 +80,7 @@ def app_with_keycloak(monkeypatch):
     return app
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def app_with_decorator():
     """Fixture to create a Flask app for testing."""
     app = Flask(__name__)
@@ -98,37 +99,49 @@ def app_with_decorator():
     return app
 
 
-def test_set_theme(app_with_context, monkeypatch):
+def test_set_theme(decorated_app, monkeypatch):
     """Test the set_theme decorator."""
-    monkeypatch.setenv("THEME", "default")
-    monkeypatch.setenv("PORTAL_NAME", "RIS Synergy")
+    monkeypatch.setitem(decorated_app.config, "THEME", "default")
+    monkeypatch.setitem(decorated_app.config, "PORTAL_NAME", "RIS Synergy")
 
-    client = app_with_context.test_client()
-    response = client.get("/theme")
-    data = response.get_json()
-    assert data["theme"] == "default"
-    assert data["portal_name"] == "RIS Synergy"
+    with decorated_app.test_request_context("/theme"):
+        theme, portal_name = set_theme(
+            lambda: (request.theme, request.portal_name)
+        )()
+    assert theme == "default"
+    assert portal_name == "RIS Synergy"
 
 
-def test_set_matomo_enabled(app_with_context, monkeypatch):
+def test_set_matomo_enabled(decorated_app, monkeypatch):
     """Test the set_matomo_enabled decorator."""
-    monkeypatch.setenv("MATOMO_ENABLED", "true")
-    monkeypatch.setenv("MATOMO_URL", "")
-    monkeypatch.setenv("MATOMO_SITE_ID", "")
+    monkeypatch.setitem(decorated_app.config, "MATOMO_ENABLED", "true")
+    monkeypatch.setitem(decorated_app.config, "MATOMO_URL", "")
+    monkeypatch.setitem(decorated_app.config, "MATOMO_SITE_ID", "")
 
-    client = app_with_context.test_client()
-    response = client.get("/matomo")
-    data = response.get_json()
-    assert data["matomo_enabled"] == "true"
-    assert data["matomo_url"] == ""
-    assert data["matomo_site_id"] == ""
+    with decorated_app.test_request_context("/matomo"):
+        matomo = set_matomo_enabled(
+            lambda: (request.matomo_enabled, request.matomo_url, request.matomo_site_id)
+        )()
+    assert matomo == ("true", "", "")
 
 
-def test_caching(app_with_context):
+def test_caching(decorated_app):
     """Test the caching decorator."""
-    client = app_with_context.test_client()
-    response = client.get("/cache")
+    with decorated_app.test_request_context("/cache"):
+        response = caching(3600)(lambda: "cached content")()
     assert response.headers["Cache-Control"] == "max-age=3600"
+    assert response.get_data(as_text=True) == "cached content"
+
+
+def test_decorated_routes(app_with_context, monkeypatch):
+    """Test the decorators end-to-end on registered routes."""
+    monkeypatch.setitem(app_with_context.config, "THEME", "default")
+    monkeypatch.setitem(app_with_context.config, "MATOMO_URL", "")
+    client = app_with_context.test_client()
+
+    assert client.get("/theme").get_json()["theme"] == "default"
+    assert client.get("/matomo").get_json()["matomo_url"] == ""
+    assert client.get("/cache").headers["Cache-Control"] == "max-age=3600"
 
 
 def test_conditional_produces(app_with_context):
@@ -139,6 +152,28 @@ def test_conditional_produces(app_with_context):
     assert response.json == {"content": "some content"}
 
 
+@pytest.mark.parametrize(
+    "mime_type,accept,acceptable",
+    [
+        ("application/json", "application/json", True),
+        ("application/ld+json", "application/ld+json", True),
+        ("application/ld+json", "application/json", False),
+        ("application/json", "text/html, application/json;q=0.9", True),
+        ("application/json", "*/*", False),
+    ],
+)
+def test_conditional_produces_mime_types(decorated_app, mime_type, accept, acceptable):
+    """Test that conditional_produces matches the mime type it was created with."""
+    with patch("app.decorators.ENFORCE_CONTENT_NEGOTIATION", True):
+        view = conditional_produces(mime_type)(lambda: "content")
+    with decorated_app.test_request_context(headers={"Accept": accept}):
+        if acceptable:
+            assert view() == "content"
+        else:
+            with pytest.raises(NotAcceptable):
+                view()
+
+
 def test_keycloak_protected_valid_token(app_with_keycloak):
     """Test the decorator with a valid token."""
     with app_with_keycloak.test_client() as client:
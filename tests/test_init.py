@@ -5,7 +5,9 @@ Module for testing environment variable setup and checks.
 
 import logging
 import os
+import sys
 import time
+import types
 from unittest.mock import patch, MagicMock
 import pytest
 from flask import Flask, g, jsonify
@@ -20,16 +22,27 @@ from app import (
     validate_app_env,
     apply_csp,
     apply_clickjacking_protection,
+    refresh_security_headers,
 )
+import app as app_module
 
 
-@pytest.fixture
-def flask_app():
-    """Fixture to provide a Flask app instance."""
+@pytest.fixture(scope="module")
+def shared_flask_app():
+    """Fixture to create a Flask app instance once per module."""
     return Flask(__name__)
 
 
 @pytest.fixture
+def flask_app(shared_flask_app):
+    """Provide the shared Flask app and restore its config after each test."""
+    config = dict(shared_flask_app.config)
+    yield shared_flask_app
+    shared_flask_app.config.clear()
+    shared_flask_app.config.update(config)
+
+
+@pytest.fixture(scope="module")
 def test_flask_app():
     """
     Create and configure a Flask app for testing.
@@ -40,18 +53,21 @@ def test_flask_app():
     def test_route():
         return jsonify({"message": "Hello, world!"})
 
+    # Tests can replace the clock instead of patching time.time
+    app.config["CLOCK"] = time.time
+
     # Include the actual before_request and after_request handlers
     @app.before_request
     def before_request():
-        g.request_start_time = time.time()
-        g.request_time = lambda: f"{time.time() - g.request_start_time:.5f}s"
+        clock = app.config["CLOCK"]
+        g.request_start_time = clock()
+        g.request_time = lambda: f"{clock() - g.request_start_time:.5f}s"
 
     return app
 
 
-@pytest.fixture
-def app_with_clickjacking_protection(monkeypatch):
-    """Fixture to create a Flask app with the after_request clickjacking protection applied."""
+def create_app_with_hook(after_request_hook):
+    """Create a Flask app with a test route and the given after_request hook."""
     app = Flask(__name__)
     app.config["TESTING"] = True
 
@@ -59,58 +75,42 @@ def app_with_clickjacking_protection(monkeypatch):
     def test_route():
         return jsonify({"message": "Test response"})
 
-    # Register the actual apply_clickjacking_protection function
-    app.after_request(apply_clickjacking_protection)
-
+    app.after_request(after_request_hook)
     return app
 
 
-@pytest.fixture
-def app_with_csp():
-    """Fixture to create a Flask app with the after_request CSP applied."""
-    app = Flask(__name__)
-    app.config["TESTING"] = True
-
-    @app.route("/test")
-    def test_route():
-        return jsonify({"message": "Test response"})
+@pytest.fixture(scope="module")
+def app_with_clickjacking_protection():
+    """Fixture to create a Flask app with the after_request clickjacking protection applied."""
+    return create_app_with_hook(apply_clickjacking_protection)
 
-    # Register the actual apply_csp function
-    app.after_request(apply_csp)
 
-    return app
+@pytest.fixture(scope="module")
+def app_with_csp():
+    """Fixture to create a Flask app with the after_request CSP applied."""
+    return create_app_with_hook(apply_csp)
 
 
 @pytest.fixture
-def app_with_clickjacking_protection(monkeypatch):
-    """Fixture to create a Flask app with the after_request clickjacking protection applied."""
-    app = Flask(__name__)
-    app.config["TESTING"] = True
-
-    @app.route("/test")
-    def test_route():
-        return jsonify({"message": "Test response"})
-
-    # Register the actual apply_clickjacking_protection function
-    app.after_request(apply_clickjacking_protection)
-
-    return app
+def security_headers():
+    """
+    Provide refresh_security_headers and restore the cached headers after the test.
+    """
+    saved = dict(app_module._FRAME_HEADERS)  # pylint: disable=protected-access
+    yield refresh_security_headers
+    app_module._FRAME_HEADERS.clear()  # pylint: disable=protected-access
+    app_module._FRAME_HEADERS.update(saved)  # pylint: disable=protected-access
 
 
 @pytest.fixture
-def setup_env():
+def setup_env(monkeypatch):
     """
     Fixture to set environment variables for testing.
     """
-    os.environ["SECRET_KEY"] = "test_secret"
-    os.environ["STATIC_URL_PATH"] = "/static"
-    os.environ["STATIC_FOLDER"] = "static"
-    os.environ["ENABLED_BLUEPRINTS"] = "public"
-    yield
-    os.environ.pop("SECRET_KEY", None)
-    os.environ.pop("STATIC_URL_PATH", None)
-    os.environ.pop("STATIC_FOLDER", None)
-    os.environ.pop("ENABLED_BLUEPRINTS", None)
+    monkeypatch.setenv("SECRET_KEY", "test_secret")
+    monkeypatch.setenv("STATIC_URL_PATH", "/static")
+    monkeypatch.setenv("STATIC_FOLDER", "static")
+    monkeypatch.setenv("ENABLED_BLUEPRINTS", "public")
 
 
 @pytest.fixture
@@ -132,21 +132,15 @@ def test_env_file_exists(tmp_path, monkeypatch):
     # Change working directory to tmp_path so ".env" matches dummy_env
     monkeypatch.chdir(tmp_path)
 
-    # Mock os.path.isfile to return True for the ".env" file in the current directory
-    monkeypatch.setattr("os.path.isfile", lambda x: x == ".env")
-
-    # Debugging: Print current working directory and files
-    print("Current working directory:", os.getcwd())
-    print("Files in current directory:", os.listdir(os.getcwd()))
-
     assert check_if_env_file_exists() is True
 
 
-def test_env_file_missing(monkeypatch):
+def test_env_file_missing(tmp_path, monkeypatch):
     """
     Test if .env file missing is correctly identified.
     """
-    monkeypatch.setattr("os.path.isfile", lambda _: False)
+    # An empty working directory has no ".env" file
+    monkeypatch.chdir(tmp_path)
     assert check_if_env_file_exists() is False
 
 
@@ -161,7 +155,15 @@ def test_required_env_variables_missing(monkeypatch):
     """
     Test if missing environment variables are correctly flagged.
     """
-    monkeypatch.setattr("os.getenv", lambda x: None if x == "SECRET_KEY" else "value")
+    monkeypatch.delenv("SECRET_KEY", raising=False)
+    assert check_if_required_env_variables_are_set() is False
+
+
+def test_required_env_variables_empty(monkeypatch):
+    """
+    Test that an empty required environment variable counts as missing.
+    """
+    monkeypatch.setenv("SECRET_KEY", "")
     assert check_if_required_env_variables_are_set() is False
 
 
@@ -208,10 +210,13 @@ def test_keycloak_settings_configured(monkeypatch, flask_app):
     monkeypatch.setenv("OIDC_CREDENTIALS_SECRET", "test_secret")
     monkeypatch.setenv("KEYCLOAK_TOKEN_URI", "https://example.com/token")
     monkeypatch.setenv("KEYCLOAK_INTROSPECT_URI", "https://example.com/introspect")
+    # Set after app.auth was imported, like a value loaded from .env
+    monkeypatch.setenv("KEYCLOAK_TOKEN_CACHE_TTL", "0")
 
     result = configure_keycloak_settings(flask_app)
 
     assert result is True
+    assert flask_app.config["KEYCLOAK_TOKEN_CACHE_TTL"] == 0
     assert flask_app.config["OIDC_CLIENT_ID"] == "test_client_id"
     assert flask_app.config["OIDC_CREDENTIALS_SECRET"] == "test_secret"
     assert flask_app.config["KEYCLOAK_TOKEN_URI"] == "https://example.com/token"
@@ -328,7 +333,7 @@ def test_configure_logger_value_error(monkeypatch, flask_app):
     monkeypatch.setattr("app.create_log_folder", lambda: None)
 
     # Replace Flask app logger with a custom logger to avoid conflicts
-    flask_app.logger = logging.getLogger("test_logger")
+    monkeypatch.setattr(flask_app, "logger", logging.getLogger("test_logger"))
 
     # Mock print and sys.exit
     with patch("builtins.print") as mock_print, patch("sys.exit") as mock_exit:
@@ -386,84 +391,52 @@ def test_register_blueprints_custom(monkeypatch, flask_app):
     mock_blueprint = MagicMock()
     monkeypatch.setattr("app.public_blueprint", mock_blueprint)
 
-    # Mock the custom blueprint
+    # Provide the custom blueprint modules through the module cache
     mock_custom_blueprint = MagicMock()
+    for name in ("custom1", "custom2"):
+        monkeypatch.setitem(
+            sys.modules,
+            f"app.{name}.views",
+            types.SimpleNamespace(blueprint=mock_custom_blueprint),
+        )
 
-    # Mock the __import__ function to return a module with a `blueprint` attribute
-    mock_module = MagicMock()
-    mock_module.blueprint = mock_custom_blueprint
-    with patch("builtins.__import__", return_value=mock_module):
-        # Set ENABLED_BLUEPRINTS environment variable
-        monkeypatch.setenv("ENABLED_BLUEPRINTS", "custom1,custom2")
-
-        # Mock the Flask app's `register_blueprint` method
-        with patch.object(
-            flask_app, "register_blueprint", wraps=flask_app.register_blueprint
-        ) as mock_register:
-            register_blueprints(flask_app)
-
-            # Assert the public blueprint is registered
-            mock_register.assert_any_call(mock_blueprint)
-
-            # Assert the custom blueprints are registered
-            mock_register.assert_any_call(mock_custom_blueprint)
-
-
-def test_register_blueprints_import_error(monkeypatch, flask_app):
-    """
-    Test blueprint registration with ImportError.
-    """
-    # Mock public blueprint
-    mock_blueprint = MagicMock()
-    monkeypatch.setattr("app.public_blueprint", mock_blueprint)
-
-    # Set ENABLED_BLUEPRINTS
-    monkeypatch.setenv("ENABLED_BLUEPRINTS", "invalid_blueprint")
-
-    # Mock __import__ to raise ImportError
-    with patch("builtins.__import__", side_effect=ImportError("Mocked ImportError")):
-        # Mock print and sys.exit
-        with patch("builtins.print") as mock_print, patch("sys.exit") as mock_exit:
-            register_blueprints(flask_app)
-
-            # Assert error message was printed
-            mock_print.assert_any_call(
-                "Failed to import or register blueprint: Mocked ImportError"
-            )
-
-            # Assert sys.exit was NOT called (the function continues execution for other blueprints)
-            mock_exit.assert_not_called()
-
-
-def test_register_blueprints_attribute_error(monkeypatch, flask_app):
-    """
-    Test blueprint registration with AttributeError.
-    """
-    # Mock public blueprint
-    mock_blueprint = MagicMock()
-    monkeypatch.setattr("app.public_blueprint", mock_blueprint)
-
-    # Set ENABLED_BLUEPRINTS
-    monkeypatch.setenv("ENABLED_BLUEPRINTS", "invalid_blueprint")
-
-    # Mock __import__ to raise AttributeError
-    with patch(
-        "builtins.__import__", side_effect=AttributeError("Mocked AttributeError")
-    ):
-        # Mock print and sys.exit
-        with patch("builtins.print") as mock_print, patch("sys.exit") as mock_exit:
-            register_blueprints(flask_app)
-
-            # Assert error message was printed
-            mock_print.assert_any_call("AttributeError: Mocked AttributeError")
-
-            # Assert sys.exit was called with the appropriate error message
-            mock_exit.assert_called_once_with("Error: registering blueprints")
+    # Set ENABLED_BLUEPRINTS environment variable
+    monkeypatch.setenv("ENABLED_BLUEPRINTS", "custom1,custom2")
 
+    # Mock the Flask app's `register_blueprint` method
+    with patch.object(
+        flask_app, "register_blueprint", wraps=flask_app.register_blueprint
+    ) as mock_register:
+        register_blueprints(flask_app)
 
-def test_register_blueprints_type_error(monkeypatch, flask_app):
+        # Assert the public blueprint is registered
+        mock_register.assert_any_call(mock_blueprint)
+
+        # Assert the custom blueprints are registered
+        assert mock_register.call_count == 3
+        mock_register.assert_any_call(mock_custom_blueprint)
+
+
+@pytest.mark.parametrize(
+    "module,message,exits",
+    [
+        # Not in the module cache and not on disk
+        (None, "Failed to import or register blueprint: No module named", False),
+        # A views module without a blueprint
+        (types.SimpleNamespace(), "AttributeError: ", True),
+        # A blueprint whose register() has the wrong signature
+        (
+            types.SimpleNamespace(
+                blueprint=types.SimpleNamespace(register=lambda: None)
+            ),
+            "TypeError: ",
+            True,
+        ),
+    ],
+)
+def test_register_blueprints_errors(monkeypatch, flask_app, module, message, exits):
     """
-    Test blueprint registration with TypeError.
+    Test blueprint registration errors; only an ImportError lets the app continue.
     """
     # Mock public blueprint
     mock_blueprint = MagicMock()
@@ -471,18 +444,22 @@ def test_register_blueprints_type_error(monkeypatch, flask_app):
 
     # Set ENABLED_BLUEPRINTS
     monkeypatch.setenv("ENABLED_BLUEPRINTS", "invalid_blueprint")
+    if module is not None:
+        monkeypatch.setitem(sys.modules, "app.invalid_blueprint.views", module)
 
-    # Mock __import__ to raise TypeError
-    with patch("builtins.__import__", side_effect=TypeError("Mocked TypeError")):
-        # Mock print and sys.exit
-        with patch("builtins.print") as mock_print, patch("sys.exit") as mock_exit:
-            register_blueprints(flask_app)
+    # Mock print and sys.exit
+    with patch("builtins.print") as mock_print, patch("sys.exit") as mock_exit:
+        register_blueprints(flask_app)
 
-            # Assert error message was printed
-            mock_print.assert_any_call("TypeError: Mocked TypeError")
+    # Assert error message was printed
+    printed = [str(call.args[0]) for call in mock_print.call_args_list if call.args]
+    assert any(line.startswith(message) for line in printed)
 
-            # Assert sys.exit was called with the appropriate error message
-            mock_exit.assert_called_once_with("Error: registering blueprints")
+    if exits:
+        mock_exit.assert_called_once_with("Error: registering blueprints")
+    else:
+        # The function continues execution for other blueprints
+        mock_exit.assert_not_called()
 
 
 def test_create_app_with_static_paths(monkeypatch):
@@ -539,46 +516,17 @@ def test_create_app_without_static_paths(monkeypatch):
     )  # Match Flask's default behavior
 
 
-def test_before_request(client):
+def test_before_request(client, test_flask_app, monkeypatch):
     """
     Test that the before_request function sets request_start_time and request_time.
     """
-    with patch("time.time", return_value=12345.678):
-        response = client.get("/test")
-        assert response.status_code == 200
-        assert g.request_start_time == 12345.678
-        assert callable(g.request_time)
-        assert g.request_time() == "0.00000s"
-
-
-def test_apply_clickjacking_protection_default(client, monkeypatch):
-    """
-    Test the apply_clickjacking_protection function with default settings.
-    """
-    # Ensure ALLOWED_SOURCES is unset
-    monkeypatch.delenv("ALLOWED_SOURCES", raising=False)
-
-    response = client.get("/test")
-    assert response.status_code == 200
-    assert response.headers["X-Frame-Options"] == "SAMEORIGIN"
-    assert response.headers["Content-Security-Policy"] == "frame-ancestors 'self'"
-    assert response.headers["X-Content-Type-Options"] == "nosniff"
-
-
-def test_apply_clickjacking_protection_allowed_sources(client, monkeypatch):
-    """
-    Test the apply_clickjacking_protection function when ALLOWED_SOURCES is set.
-    """
-    monkeypatch.setenv("ALLOWED_SOURCES", "https://example.com")
+    monkeypatch.setitem(test_flask_app.config, "CLOCK", lambda: 12345.678)
 
     response = client.get("/test")
     assert response.status_code == 200
-    assert response.headers["X-Frame-Options"] == "ALLOW-FROM  https://example.com"
-    assert (
-        response.headers["Content-Security-Policy"]
-        == "frame-ancestors https://example.com"
-    )
-    assert response.headers["X-Content-Type-Options"] == "nosniff"
+    assert g.request_start_time == 12345.678
+    assert callable(g.request_time)
+    assert g.request_time() == "0.00000s"
 
 
 def test_apply_csp(app_with_csp):
@@ -605,11 +553,12 @@ def test_apply_csp(app_with_csp):
 
 
 def test_apply_clickjacking_protection_default(
-    app_with_clickjacking_protection, monkeypatch
+    app_with_clickjacking_protection, monkeypatch, security_headers
 ):
     """Test the default clickjacking protection headers."""
     # Override ALLOWED_SOURCES to ensure default behavior
     monkeypatch.delenv("ALLOWED_SOURCES", raising=False)
+    security_headers()
 
     with app_with_clickjacking_protection.test_client() as client:
         response = client.get("/test")
@@ -622,11 +571,12 @@ def test_apply_clickjacking_protection_default(
 
 
 def test_apply_clickjacking_protection_allowed_sources(
-    app_with_clickjacking_protection, monkeypatch
+    app_with_clickjacking_protection, monkeypatch, security_headers
 ):
     """Test clickjacking protection headers when ALLOWED_SOURCES is set."""
     allowed_sources = "https://example.com"
     monkeypatch.setenv("ALLOWED_SOURCES", allowed_sources)
+    security_headers()
 
     with app_with_clickjacking_protection.test_client() as client:
         response = client.get("/test")
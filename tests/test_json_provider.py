@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+This module contains tests for the msgspec JSON provider.
+"""
+
+import pytest
+from flask import Flask, jsonify, request
+from app.json_provider import MsgspecJSONProvider, register_json_provider
+
+
+@pytest.fixture
+def app():
+    """Fixture to create a Flask app with the msgspec JSON provider."""
+    app = Flask(__name__)
+    register_json_provider(app)
+
+    @app.route("/echo", methods=["POST"])
+    def echo():
+        return jsonify(request.get_json())
+
+    return app
+
+
+def test_register_json_provider(app):
+    """Test that the provider is installed on the app."""
+    assert isinstance(app.json, MsgspecJSONProvider)
+
+
+def test_dumps_unsorted_and_unicode(app):
+    """Test that key order is kept and non-ASCII characters are not escaped."""
+    assert app.json.dumps({"b": 1, "a": "Universität"}) == '{"b":1,"a":"Universität"}'
+
+
+def test_dumps_sorted(app):
+    """Test that keys are sorted when sorting is enabled."""
+    app.json.sort_keys = True
+    assert app.json.dumps({"b": 1, "a": 2}) == '{"a":2,"b":1}'
+
+
+def test_dumps_indent_falls_back(app):
+    """Test that pretty-printing falls back to the standard library."""
+    assert app.json.dumps({"a": 1}, indent=2) == '{\n  "a": 1\n}'
+
+
+def test_dumps_debug_keeps_unicode(app):
+    """Test that pretty-printed output in debug mode does not escape non-ASCII."""
+    app.debug = True
+    with app.app_context():
+        response = jsonify({"a": "Universität"})
+    assert response.get_data(as_text=True) == '{\n  "a": "Universität"\n}\n'
+
+
+def test_dumps_ensure_ascii_attribute_falls_back(app):
+    """Test that enabling ensure_ascii on the provider escapes non-ASCII."""
+    app.json.ensure_ascii = True
+    assert app.json.dumps({"a": "ä"}) == '{"a": "\\u00e4"}'
+
+
+def test_dumps_ensure_ascii_falls_back(app):
+    """Test that ensure_ascii output falls back to the standard library."""
+    assert app.json.dumps({"a": "Universität"}, ensure_ascii=True) == (
+        '{"a": "Universit\\u00e4t"}'
+    )
+
+
+def test_dumps_separators_falls_back(app):
+    """Test that non-compact separators fall back to the standard library."""
+    assert app.json.dumps({"a": 1, "b": 2}, separators=(", ", ": ")) == (
+        '{"a": 1, "b": 2}'
+    )
+
+
+def test_dumps_compact_args(app):
+    """Test that compact separators and ensure_ascii=False are handled by msgspec."""
+    assert (
+        app.json.dumps({"a": "ä"}, separators=(",", ":"), ensure_ascii=False)
+        == '{"a":"ä"}'
+    )
+
+
+def test_dumps_unsupported_type(app):
+    """Test that unsupported types raise a TypeError."""
+    with pytest.raises(TypeError):
+        app.json.dumps({"a": object()})
+
+
+def test_loads(app):
+    """Test decoding JSON strings and bytes."""
+    assert app.json.loads('{"a": [1, 2]}') == {"a": [1, 2]}
+    assert app.json.loads(b'{"a": null}') == {"a": None}
+
+
+def test_request_round_trip(app):
+    """Test that request bodies and responses go through the provider."""
+    client = app.test_client()
+    response = client.post("/echo", json={"name": "Universität", "id": 1})
+    assert response.status_code == 200
+    assert response.get_json() == {"name": "Universität", "id": 1}
+
+
+def test_invalid_request_body(app):
+    """Test that invalid JSON request bodies result in a 400 error."""
+    client = app.test_client()
+    response = client.post(
+        "/echo", data="{invalid", content_type="application/json"
+    )
+    assert response.status_code == 400
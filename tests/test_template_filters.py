@@ -6,12 +6,12 @@ This module contains tests for template filters.
 from datetime import datetime
 import pytest
 from flask import Flask
-from app.template_filters import register_template_filters
+from app.template_filters import format_isoformat, register_template_filters
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def app():
-    """Fixture to create a Flask app and register template filters."""
+    """Fixture to create a Flask app and register template filters (once per module)."""
     app = Flask(__name__)
     register_template_filters(app)
     return app
@@ -49,3 +49,22 @@ def test_isoformat_to_human_none(app):
         input_value = None
         result = app.jinja_env.filters["isoformat_to_human"](input_value)
         assert result == ""  # Should return an empty string
+
+
+def test_isoformat_to_human_empty(app):
+    """Test that an empty string is returned without parsing."""
+    format_isoformat.cache_clear()
+    with app.app_context():
+        result = app.jinja_env.filters["isoformat_to_human"]("")
+        assert result == ""
+    assert format_isoformat.cache_info().misses == 0
+
+
+def test_isoformat_to_human_memoized(app):
+    """Test that repeated conversions are served from the cache."""
+    format_isoformat.cache_clear()
+    with app.app_context():
+        isoformat_to_human = app.jinja_env.filters["isoformat_to_human"]
+        assert isoformat_to_human("2024-11-22T14:30:00") == "November 22, 2024 14:30"
+        assert isoformat_to_human("2024-11-22T14:30:00") == "November 22, 2024 14:30"
+    assert format_isoformat.cache_info().hits == 1
@@ -15,6 +15,9 @@ This file is commonly used in production with a WSGI server such as Gunicorn or
 For example:
     gunicorn wsgi:app
 
+When started from the repository root, Gunicorn picks up `gunicorn.conf.py`, which
+runs gevent workers by default.
+
 Direct Execution:
 The app can also be started using Flask's built-in development server by running:
     python wsgi.py